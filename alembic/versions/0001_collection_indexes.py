@@ -0,0 +1,37 @@
+"""add collection listing index and per-user name uniqueness
+
+Revision ID: 0001_collection_indexes
+Revises: 
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_collection_indexes'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Base.metadata.create_all at startup may have created these from the model already
+    inspector = sa.inspect(op.get_bind())
+    index_names = {index['name'] for index in inspector.get_indexes('collections')}
+    unique_names = {constraint['name'] for constraint in inspector.get_unique_constraints('collections')}
+    
+    if 'ix_collections_user_created' not in index_names:
+        op.create_index(
+            'ix_collections_user_created',
+            'collections',
+            ['user_id', sa.text('created_at DESC')],
+        )
+    if 'uq_collections_user_name' not in unique_names:
+        op.create_unique_constraint('uq_collections_user_name', 'collections', ['user_id', 'name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_collections_user_name', 'collections', type_='unique')
+    op.drop_index('ix_collections_user_created', table_name='collections')
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
@@ -12,7 +12,7 @@ from app.schemas.collection import (
     CollectionWithStats,
     CollectionListResponse
 )
-from app.services.collection_service import CollectionService
+from app.services.collection_service import CollectionService, _COLLECTIONS_WITH_STATS_ADAPTER
 from app.middleware.rate_limit import limiter
 
 router = APIRouter()
@@ -39,7 +39,11 @@ async def get_collections_with_stats(
     """Get all collections for the current user with recipe counts."""
     collection_service = CollectionService(db)
     collections = collection_service.get_user_collections_with_stats(current_user.id, skip, limit)
-    return collections
+    # Already validated by the service; serialize directly without response_model re-validation
+    return Response(
+        content=_COLLECTIONS_WITH_STATS_ADAPTER.dump_json(collections),
+        media_type="application/json"
+    )
 
 @router.get("/{collection_id}", response_model=CollectionSchema)
 async def get_collection(
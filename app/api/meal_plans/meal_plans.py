@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
@@ -12,6 +13,8 @@ from app.core.tier_enforcement import check_meal_plan_save
 
 router = APIRouter()
 
+_ACTIVE_MEAL_PLAN_ADAPTER = TypeAdapter(MealPlanWithRecipeDetails)
+
 @router.get("/", response_model=List[MealPlanSchema])
 async def get_meal_plans(
     skip: int = Query(0, ge=0),
@@ -50,7 +53,13 @@ async def get_active_meal_plan(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active meal plan found"
         )
-    return active_meal_plan
+    # Serialize once and return directly, skipping FastAPI's response_model re-validation
+    return Response(
+        content=_ACTIVE_MEAL_PLAN_ADAPTER.dump_json(
+            _ACTIVE_MEAL_PLAN_ADAPTER.validate_python(active_meal_plan, from_attributes=True)
+        ),
+        media_type="application/json"
+    )
 
 @router.get("/{meal_plan_id}", response_model=MealPlanSchema)
 async def get_meal_plan(
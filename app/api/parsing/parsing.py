@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 import uuid
 import asyncio
 import json
@@ -96,11 +96,18 @@ async def parse_recipe_from_url(
 async def parse_recipe_from_url_stream(
     stream_request: URLParseStreamRequest,
     request: Request,
+    stream_format: Literal["sse", "ndjson"] = Query("sse", alias="format"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Stream real-time progress updates while parsing recipe from URL"""
     session_id = str(uuid.uuid4())
+    # NDJSON drops the SSE framing for clients that read the body as a plain stream
+    ndjson = stream_format == "ndjson"
+    
+    def frame(payload: Dict[str, Any]) -> str:
+        body = json.dumps(payload)
+        return f"{body}\n" if ndjson else f"data: {body}\n\n"
     
     async def event_stream():
         try:
@@ -114,7 +121,7 @@ async def parse_recipe_from_url_stream(
             
             # Stream progress events
             async for event in progress_stream.subscribe_to_session(session_id):
-                yield event.to_sse_format()
+                yield event.to_ndjson_bytes() if ndjson else event.to_sse_bytes()
                 
                 # Stop streaming if completed or failed
                 if event.phase in [ProgressPhase.COMPLETED, ProgressPhase.FAILED]:
@@ -129,7 +136,7 @@ async def parse_recipe_from_url_stream(
                     "event": "result",
                     "data": result
                 }
-                yield f"data: {json.dumps(final_event)}\n\n"
+                yield frame(final_event)
                 
             except Exception as e:
                 # Send error as final event
@@ -140,7 +147,7 @@ async def parse_recipe_from_url_stream(
                         "message": str(e)
                     }
                 }
-                yield f"data: {json.dumps(error_event)}\n\n"
+                yield frame(error_event)
                 
         except asyncio.CancelledError:
             # Client disconnected
@@ -154,14 +161,14 @@ async def parse_recipe_from_url_stream(
                     "message": str(e)
                 }
             }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield frame(error_event)
         finally:
             # Cleanup session
             progress_stream.cleanup_session(session_id)
     
     return StreamingResponse(
         event_stream(),
-        media_type="text/event-stream",
+        media_type="application/x-ndjson" if ndjson else "text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
@@ -265,7 +272,7 @@ async def parse_instagram_profile(
     """Parse recipes from an Instagram profile"""
     parsing_service = ParsingService(db)
     try:
-        recipes = parsing_service.instagram_parser.parse_instagram_profile(
+        recipes = await parsing_service.instagram_parser.parse_instagram_profile(
             profile_request.username, 
             profile_request.max_posts
         )
@@ -298,7 +305,7 @@ async def search_recipes_by_hashtag(
     """Search for recipes using Instagram hashtags"""
     parsing_service = ParsingService(db)
     try:
-        recipes = parsing_service.instagram_parser.search_recipe_hashtags(
+        recipes = await parsing_service.instagram_parser.search_recipe_hashtags(
             hashtag_request.hashtag, 
             hashtag_request.max_posts
         )
@@ -37,6 +37,11 @@ class Settings(BaseSettings):
     # Rate Limiting Configuration
     RATE_LIMIT_ENABLED: bool = True
     
+    # Shared rate limit storage (e.g. redis://localhost:6379/0).
+    # Falls back to per-process in-memory storage when unset.
+    RATE_LIMIT_STORAGE_URL: str = ""
+    RATE_LIMIT_STRATEGY: str = "moving-window"  # or "fixed-window" (1 round trip per request)
+    
     # Default rate limits (requests per minute)
     DEFAULT_RATE_LIMIT: str = "100/minute"
     
@@ -51,6 +56,18 @@ class Settings(BaseSettings):
     COLLECTION_RATE_LIMIT: str = "30/minute"
     USER_RATE_LIMIT: str = "20/minute"
     
+    # Outbound scraping: requests a site may receive back to back after being idle
+    RATE_LIMIT_BURST: int = 1
+    
+    # Browser automation pool (Playwright)
+    BROWSER_POOL_SIZE: int = 4
+    BROWSER_POOL_RECYCLE_AFTER: int = 50  # Relaunch a browser after this many uses
+    BROWSER_CDP_URL: str = ""  # e.g. http://localhost:9222 to share one external Chromium
+    
+    # spaCy batching for ingredient tagging
+    SPACY_BATCH_SIZE: int = 32
+    SPACY_N_PROCESS: int = 1  # -1 uses every core; worth it only for large batches
+    
     # Request size limits (in bytes)
     MAX_REQUEST_SIZE: int = 10 * 1024 * 1024  # 10MB
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024   # 10MB
@@ -66,6 +83,9 @@ class Settings(BaseSettings):
     LOG_SECURITY_EVENTS: bool = True
     LOG_FILE_UPLOADS: bool = True
     
+    # Maximum log records buffered for the background log writer (extra records are dropped)
+    LOG_QUEUE_MAX_SIZE: int = 10000
+    
     @field_validator('ALLOWED_ORIGINS', mode='before')
     @classmethod
     def parse_cors_origins(cls, v):
@@ -0,0 +1,56 @@
+"""
+Non-blocking logging setup for the HomeChef Companion backend.
+Routes root log records through a bounded queue so request handlers never block on log IO.
+"""
+
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+from app.core.config import settings
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking or erroring when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def configure_async_logging() -> None:
+    """
+    Move the root logger's handlers behind a QueueHandler.
+
+    The existing handlers (or a stderr StreamHandler if none are configured)
+    are driven by a QueueListener on a background thread.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    root = logging.getLogger()
+    handlers = list(root.handlers) or [logging.StreamHandler()]
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE)
+    root.addHandler(DroppingQueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+def shutdown_async_logging() -> None:
+    """Flush queued records and stop the background listener"""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
@@ -1,10 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi.errors import RateLimitExceeded
 from app.core.config import settings
 from app.core.database import engine
 from app.core.startup import startup_event
+from app.core.logging_config import configure_async_logging, shutdown_async_logging
+from app.services.parsers.browser_automation import warm_browser_pool, close_browser_pool
 from app.models import Base
 from app.api.auth import auth_router
 from app.api.recipes import recipes_router
@@ -22,7 +25,8 @@ Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="HomeChef Companion API",
     description="Backend API for Recipe Management PWA",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure rate limiting
@@ -31,7 +35,11 @@ if settings.RATE_LIMIT_ENABLED:
     app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
 # Add startup event handler
+app.add_event_handler("startup", configure_async_logging)
 app.add_event_handler("startup", startup_event)
+app.add_event_handler("startup", warm_browser_pool)
+app.add_event_handler("shutdown", close_browser_pool)
+app.add_event_handler("shutdown", shutdown_async_logging)
 
 # Add security headers middleware (should be added before CORS)
 app.add_middleware(SecurityHeadersMiddleware)
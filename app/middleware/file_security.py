@@ -3,6 +3,13 @@ Secure file upload validation middleware for Recipe Catalogue.
 Provides comprehensive file validation, content inspection, and security checks.
 """
 
+try:
+    import puremagic
+    PUREMAGIC_AVAILABLE = True
+except ImportError:
+    PUREMAGIC_AVAILABLE = False
+    puremagic = None
+
 try:
     import magic
     MAGIC_AVAILABLE = True
@@ -31,12 +38,18 @@ class FileSecurityValidator:
         'image/gif': ['.gif'],
     }
     
+    # Flattened lookups so validation is a single hash probe
+    _ALLOWED_MIMES = frozenset(ALLOWED_MIME_TYPES)
+    _ALLOWED_PAIRS = frozenset(
+        (mime, ext) for mime, exts in ALLOWED_MIME_TYPES.items() for ext in exts
+    )
+    
     # Maximum file sizes (in bytes)
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
     MAX_IMAGE_DIMENSIONS = (4096, 4096)  # 4K max resolution
     
-    # Dangerous file signatures to reject
-    DANGEROUS_SIGNATURES = [
+    # Dangerous file signatures to reject (tuple so startswith checks them in one call)
+    DANGEROUS_SIGNATURES = (
         b'\x4d\x5a',  # Windows executables (.exe, .dll)
         b'\x7f\x45\x4c\x46',  # Linux executables (ELF)
         b'\xca\xfe\xba\xbe',  # Java class files
@@ -44,13 +57,18 @@ class FileSecurityValidator:
         b'\x50\x4b\x03\x04',  # ZIP files (could contain executables)
         b'\x52\x61\x72\x21',  # RAR archives
         b'\x1f\x8b\x08',  # GZIP files
-    ]
+    )
+    
+    # Filename extensions to reject outright
+    SUSPICIOUS_EXTENSIONS = ('.exe', '.bat', '.cmd', '.scr', '.pif', '.com', '.js', '.vbs', '.jar')
     
     def __init__(self):
         """Initialize the file security validator"""
+        self.puremagic_available = PUREMAGIC_AVAILABLE
         self.magic_available = MAGIC_AVAILABLE
         if not self.magic_available:
-            logger.warning("python-magic not available, using fallback validation")
+            if not self.puremagic_available:
+                logger.warning("python-magic not available, using fallback validation")
         else:
             try:
                 # Test if python-magic is working
@@ -102,7 +120,7 @@ class FileSecurityValidator:
                     return validation_result
             
             # Security scanning
-            self._perform_security_scan(file_data, validation_result)
+            self._perform_security_scan(file_data, actual_mime_type, validation_result)
             
             # Calculate security score
             validation_result['security_score'] = self._calculate_security_score(validation_result)
@@ -165,15 +183,14 @@ class FileSecurityValidator:
         
         # Check for suspicious extensions
         filename_lower = filename.lower()
-        suspicious_extensions = ['.exe', '.bat', '.cmd', '.scr', '.pif', '.com', '.js', '.vbs', '.jar']
-        for ext in suspicious_extensions:
-            if filename_lower.endswith(ext):
-                result['errors'].append({
-                    'type': 'dangerous_extension',
-                    'severity': 'critical',
-                    'message': f'Filename has dangerous extension: {ext}'
-                })
-                return False
+        if filename_lower.endswith(self.SUSPICIOUS_EXTENSIONS):
+            ext = next(e for e in self.SUSPICIOUS_EXTENSIONS if filename_lower.endswith(e))
+            result['errors'].append({
+                'type': 'dangerous_extension',
+                'severity': 'critical',
+                'message': f'Filename has dangerous extension: {ext}'
+            })
+            return False
         
         # Check filename length
         if len(filename) > 255:
@@ -197,22 +214,30 @@ class FileSecurityValidator:
             return False
         
         # Check for dangerous file signatures
-        file_header = file_data[:12]
-        for dangerous_sig in self.DANGEROUS_SIGNATURES:
-            if file_header.startswith(dangerous_sig):
-                result['errors'].append({
-                    'type': 'dangerous_file_type',
-                    'severity': 'critical',
-                    'message': 'File contains dangerous binary signature'
-                })
-                return False
+        if file_data.startswith(self.DANGEROUS_SIGNATURES):
+            result['errors'].append({
+                'type': 'dangerous_file_type',
+                'severity': 'critical',
+                'message': 'File contains dangerous binary signature'
+            })
+            return False
         
         return True
     
     def _detect_mime_type(self, file_data: bytes) -> str:
         """Detect actual MIME type from file content"""
         try:
+            if self.puremagic_available:
+                # Header-only lookup; our allowed formats are identified by their first bytes
+                try:
+                    detected = puremagic.from_string(file_data[:32], mime=True)
+                    if detected:
+                        return detected
+                except puremagic.PureError:
+                    pass
+            
             if self.magic_available:
+                # Ambiguous or unknown headers fall through to libmagic
                 return magic.from_buffer(file_data, mime=True)
             else:
                 # Fallback: basic image signature detection
@@ -236,7 +261,7 @@ class FileSecurityValidator:
         result['metadata']['declared_mime_type'] = declared_mime
         
         # Check if MIME type is allowed
-        if actual_mime not in self.ALLOWED_MIME_TYPES:
+        if actual_mime not in self._ALLOWED_MIMES:
             result['errors'].append({
                 'type': 'unsupported_mime_type',
                 'severity': 'critical',
@@ -254,8 +279,7 @@ class FileSecurityValidator:
         
         # Check MIME type vs file extension
         file_ext = Path(filename).suffix.lower()
-        allowed_extensions = self.ALLOWED_MIME_TYPES.get(actual_mime, [])
-        if file_ext not in allowed_extensions:
+        if (actual_mime, file_ext) not in self._ALLOWED_PAIRS:
             result['warnings'].append({
                 'type': 'extension_mismatch',
                 'severity': 'warning',
@@ -307,7 +331,7 @@ class FileSecurityValidator:
         
         return True
     
-    def _perform_security_scan(self, file_data: bytes, result: Dict):
+    def _perform_security_scan(self, file_data: bytes, actual_mime: str, result: Dict):
         """Perform basic security scanning"""
         # Check for embedded scripts or suspicious content
         suspicious_patterns = [
@@ -333,16 +357,18 @@ class FileSecurityValidator:
                 })
                 break
         
-        # Calculate entropy (high entropy might indicate encrypted/compressed malware)
-        entropy = self._calculate_entropy(file_data[:1024])  # Check first 1KB
-        result['metadata']['entropy'] = entropy
-        
-        if entropy > 7.5:  # Very high entropy
-            result['warnings'].append({
-                'type': 'high_entropy',
-                'severity': 'info',
-                'message': 'File has high entropy (might be compressed/encrypted)'
-            })
+        # Calculate entropy (high entropy might indicate encrypted/compressed malware).
+        # Skipped for images: they are compressed, so high entropy is expected.
+        if not actual_mime.startswith('image/'):
+            entropy = self._calculate_entropy(file_data[:512])  # Check first 512 bytes
+            result['metadata']['entropy'] = entropy
+            
+            if entropy > 7.5:  # Very high entropy
+                result['warnings'].append({
+                    'type': 'high_entropy',
+                    'severity': 'info',
+                    'message': 'File has high entropy (might be compressed/encrypted)'
+                })
     
     def _calculate_entropy(self, data: bytes) -> float:
         """Calculate Shannon entropy of data"""
@@ -16,10 +16,15 @@ def get_rate_limit_key(request: Request) -> str:
     """
     return get_remote_address(request)
 
-# Initialize the rate limiter with in-memory storage (default)
+# Initialize the rate limiter. A shared backend (Redis/memcached) keeps counters
+# consistent across workers; in-memory storage is only accurate per process.
 limiter = Limiter(
     key_func=get_rate_limit_key,
-    default_limits=[settings.DEFAULT_RATE_LIMIT] if settings.RATE_LIMIT_ENABLED else []
+    default_limits=[settings.DEFAULT_RATE_LIMIT] if settings.RATE_LIMIT_ENABLED else [],
+    storage_uri=settings.RATE_LIMIT_STORAGE_URL or "memory://",
+    storage_options={"socket_connect_timeout": 0.1} if settings.RATE_LIMIT_STORAGE_URL.startswith("redis") else {},
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    swallow_errors=True  # Fail open if the shared storage is unreachable
 )
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
@@ -27,10 +32,11 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSO
     Custom handler for rate limit exceeded errors.
     Returns a structured JSON response without revealing internal details.
     """
+    # Root logging goes through a bounded queue (see app.core.logging_config),
+    # so a flood of rejections never blocks on log IO
     logger.warning(
-        f"Rate limit exceeded for IP: {get_remote_address(request)}, "
-        f"Path: {request.url.path}, "
-        f"Method: {request.method}"
+        "Rate limit exceeded for IP: %s, Path: %s, Method: %s",
+        get_remote_address(request), request.url.path, request.method
     )
     
     return JSONResponse(
@@ -52,5 +58,6 @@ def create_rate_limit_middleware():
         logger.info("Rate limiting is disabled in settings")
         return None
     
-    logger.info("Rate limiting middleware enabled with in-memory storage")
+    storage = "shared" if settings.RATE_LIMIT_STORAGE_URL else "in-memory"
+    logger.info(f"Rate limiting middleware enabled with {storage} storage")
     return SlowAPIMiddleware
\ No newline at end of file
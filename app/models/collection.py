@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Table, func
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Table, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 from app.utils.id_utils import generate_id
@@ -27,5 +27,15 @@ class Collection(Base):
     # Many-to-many relationship with recipes
     recipes = relationship("Recipe", secondary=collection_recipes, back_populates="collections")
     
+    # Fetch created_at/updated_at via RETURNING on INSERT/UPDATE instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        # Per-user listing ordered by newest first
+        Index("ix_collections_user_created", user_id, created_at.desc()),
+        # Name uniqueness per user (also serves the EXISTS name checks)
+        UniqueConstraint(user_id, name, name="uq_collections_user_name"),
+    )
+    
     def __repr__(self):
         return f"<Collection(id={self.id}, name={self.name}, user_id={self.user_id})>"
\ No newline at end of file
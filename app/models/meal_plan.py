@@ -18,7 +18,11 @@ class MealPlan(Base):
     is_active = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    entries = relationship("MealPlanEntry", back_populates="meal_plan", cascade="all, delete-orphan")
+    # Fetch created_at via RETURNING on INSERT instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Entries are removed by the ON DELETE CASCADE foreign key, not loaded and deleted row by row
+    entries = relationship("MealPlanEntry", back_populates="meal_plan", cascade="all, delete-orphan", passive_deletes=True)
 
 class MealPlanEntry(Base):
     __tablename__ = "meal_plan_entries"
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, ConfigDict
+
+class BaseSchema(BaseModel):
+    """Base for response schemas built from ORM objects.
+
+    Schema construction is deferred until first use, so response models a worker
+    never serves don't add to import time.
+    """
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
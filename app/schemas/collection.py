@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List
+from app.schemas._base import BaseSchema
 
 class CollectionBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, description="Collection name")
@@ -13,13 +14,11 @@ class CollectionUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = Field(None, max_length=1000)
 
-class CollectionSchema(CollectionBase):
+class CollectionSchema(CollectionBase, BaseSchema):
     id: str
     user_id: str
     created_at: datetime
     updated_at: Optional[datetime] = None
-    
-    model_config = {"from_attributes": True}
 
 
 class CollectionWithStats(CollectionSchema):
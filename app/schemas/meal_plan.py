@@ -1,13 +1,9 @@
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, TypeAlias
 from datetime import datetime, date
-from enum import Enum
+from app.schemas._base import BaseSchema
 
-class MealType(str, Enum):
-    breakfast = "breakfast"
-    lunch = "lunch"
-    dinner = "dinner"
-    snack = "snack"
+MealType: TypeAlias = Literal["breakfast", "lunch", "dinner", "snack"]
 
 class MealPlanEntryBase(BaseModel):
     recipe_id: str
@@ -18,31 +14,22 @@ class MealPlanEntryBase(BaseModel):
 class MealPlanEntryCreate(MealPlanEntryBase):
     pass
 
-class MealPlanEntry(MealPlanEntryBase):
+class MealPlanEntry(MealPlanEntryBase, BaseSchema):
     id: str
     meal_plan_id: str
 
-    class Config:
-        from_attributes = True
-
 # Enhanced meal plan entry that includes recipe details for frontend display
-class RecipeDetails(BaseModel):
+class RecipeDetails(BaseSchema):
     id: str
     title: str
     media: Optional[Dict[str, Any]] = None
     source_url: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
-class MealPlanEntryWithRecipe(MealPlanEntryBase):
+class MealPlanEntryWithRecipe(MealPlanEntryBase, BaseSchema):
     id: str
     meal_plan_id: str
     recipe: Optional[RecipeDetails] = None
 
-    class Config:
-        from_attributes = True
-
 class MealPlanBase(BaseModel):
     name: str
     start_date: Optional[date] = None
@@ -59,23 +46,17 @@ class MealPlanUpdate(BaseModel):
     is_active: Optional[bool] = None
     entries: Optional[List[MealPlanEntryCreate]] = None
 
-class MealPlan(MealPlanBase):
+class MealPlan(MealPlanBase, BaseSchema):
     id: str
     user_id: str
     is_active: bool
     created_at: datetime
     entries: List[MealPlanEntry] = []
 
-    class Config:
-        from_attributes = True
-
 # Enhanced meal plan for active meal plan endpoint with recipe details
-class MealPlanWithRecipeDetails(MealPlanBase):
+class MealPlanWithRecipeDetails(MealPlanBase, BaseSchema):
     id: str
     user_id: str
     is_active: bool
     created_at: datetime
-    entries: List[MealPlanEntryWithRecipe] = []
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    entries: List[MealPlanEntryWithRecipe] = []
\ No newline at end of file
@@ -1,14 +1,10 @@
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, TypeAlias
 from datetime import datetime
-from enum import Enum
+from app.schemas._base import BaseSchema
 
 
-class SourceType(str, Enum):
-    manual = "manual"
-    website = "website"
-    instagram = "instagram"
-    image = "image"
+SourceType: TypeAlias = Literal["manual", "website", "instagram", "image"]
 
 class TagBase(BaseModel):
     name: str
@@ -17,12 +13,9 @@ class TagBase(BaseModel):
 class TagCreate(TagBase):
     pass
 
-class Tag(TagBase):
+class Tag(TagBase, BaseSchema):
     id: str
 
-    class Config:
-        from_attributes = True
-
 class RecipeBase(BaseModel):
     title: str
     description: Optional[str] = None
@@ -30,7 +23,7 @@ class RecipeBase(BaseModel):
     cook_time: Optional[int] = None
     total_time: Optional[int] = None
     servings: Optional[int] = None
-    source_type: SourceType = SourceType.manual
+    source_type: SourceType = "manual"
     source_url: Optional[str] = None
     media: Optional[Dict[str, Any]] = None
     instructions: Optional[Dict[str, Any]] = None
@@ -57,7 +50,7 @@ class RecipeUpdate(BaseModel):
     tags: Optional[List[TagCreate]] = None
     collection_id: Optional[str] = None
 
-class Recipe(RecipeBase):
+class Recipe(RecipeBase, BaseSchema):
     id: str
     user_id: str
     created_at: datetime
@@ -65,7 +58,4 @@ class Recipe(RecipeBase):
     ingredients: Optional[Dict[str, Any]] = None
     notes: Optional[Dict[str, Any]] = None
     tags: List[Tag] = []
-    collection_id: Optional[str] = None
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    collection_id: Optional[str] = None
\ No newline at end of file
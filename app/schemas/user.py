@@ -2,6 +2,7 @@ from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
 from app.models.user import SubscriptionTier
+from app.schemas._base import BaseSchema
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -21,7 +22,7 @@ class UserSubscriptionUpdate(BaseModel):
     subscription_status: Optional[str] = None
     current_period_end: Optional[datetime] = None
 
-class User(UserBase):
+class User(UserBase, BaseSchema):
     id: str
     clerk_user_id: str
     created_at: datetime
@@ -32,7 +33,4 @@ class User(UserBase):
     stripe_customer_id: Optional[str] = None
     stripe_subscription_id: Optional[str] = None
     subscription_status: Optional[str] = None
-    current_period_end: Optional[datetime] = None
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    current_period_end: Optional[datetime] = None
\ No newline at end of file
@@ -1,10 +1,16 @@
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload, raiseload
+from sqlalchemy import delete, exists, func
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
-from app.models.collection import Collection
+from app.core.database import commit_without_expiry
+from app.models.collection import Collection, collection_recipes
 from app.models.recipe import Recipe
 from app.schemas.collection import CollectionCreate, CollectionUpdate, CollectionWithStats
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
+
+# Built once so the list validator's core schema is reused across requests
+_COLLECTIONS_WITH_STATS_ADAPTER = TypeAdapter(List[CollectionWithStats])
 
 class CollectionService:
     def __init__(self, db: Session):
@@ -19,6 +25,7 @@ class CollectionService:
         """Get all collections for a user with pagination."""
         return (
             self.db.query(Collection)
+            .options(raiseload("*"))
             .filter(Collection.user_id == user_id)
             .order_by(Collection.created_at.desc())
             .offset(skip)
@@ -33,27 +40,20 @@ class CollectionService:
         limit: int = 100
     ) -> List[CollectionWithStats]:
         """Get all collections for a user with recipe counts."""
-        # Get collections first
-        collections = (
-            self.db.query(Collection)
+        # Count recipes (direct collection_id relationship) in the same query
+        rows = (
+            self.db.query(Collection, func.count(Recipe.id).label("recipe_count"))
+            .outerjoin(Recipe, Recipe.collection_id == Collection.id)
             .filter(Collection.user_id == user_id)
+            .group_by(Collection.id)
             .order_by(Collection.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
         
-        # Calculate recipe counts for each collection
-        result = []
-        for collection in collections:
-            # Count recipes that have this collection_id (direct relationship)
-            recipe_count = (
-                self.db.query(Recipe)
-                .filter(Recipe.collection_id == collection.id)
-                .count()
-            )
-            
-            collection_dict = {
+        return _COLLECTIONS_WITH_STATS_ADAPTER.validate_python([
+            {
                 "id": collection.id,
                 "user_id": collection.user_id,
                 "name": collection.name,
@@ -62,9 +62,8 @@ class CollectionService:
                 "updated_at": collection.updated_at,
                 "recipe_count": recipe_count
             }
-            result.append(CollectionWithStats(**collection_dict))
-        
-        return result
+            for collection, recipe_count in rows
+        ])
 
     def get_collection_by_id(
         self, 
@@ -90,16 +89,14 @@ class CollectionService:
     ) -> Collection:
         """Create a new collection for a user."""
         # Check if collection name already exists for this user
-        existing = (
-            self.db.query(Collection)
-            .filter(
+        name_taken = self.db.query(
+            exists().where(
                 Collection.user_id == user_id,
                 Collection.name == collection_data.name
             )
-            .first()
-        )
+        ).scalar()
         
-        if existing:
+        if name_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Collection with name '{collection_data.name}' already exists"
@@ -113,11 +110,23 @@ class CollectionService:
         )
         
         self.db.add(db_collection)
-        self.db.commit()
-        self.db.refresh(db_collection)
+        self._commit_named(collection_data.name)
         
         return db_collection
 
+    def _commit_named(self, name: str) -> None:
+        """Commit, reporting a lost race on the per-user name constraint like the EXISTS check"""
+        try:
+            commit_without_expiry(self.db)
+        except IntegrityError as e:
+            self.db.rollback()
+            if "uq_collections_user_name" not in str(e.orig):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Collection with name '{name}' already exists"
+            )
+
     def update_collection(
         self, 
         collection_id: str, 
@@ -133,17 +142,15 @@ class CollectionService:
         # Check if new name conflicts with existing collections (if name is being changed)
         if (collection_data.name and 
             collection_data.name != db_collection.name):
-            existing = (
-                self.db.query(Collection)
-                .filter(
+            name_taken = self.db.query(
+                exists().where(
                     Collection.user_id == user_id,
                     Collection.name == collection_data.name,
                     Collection.id != collection_id
                 )
-                .first()
-            )
+            ).scalar()
             
-            if existing:
+            if name_taken:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Collection with name '{collection_data.name}' already exists"
@@ -154,8 +161,7 @@ class CollectionService:
         for field, value in update_data.items():
             setattr(db_collection, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_collection)
+        self._commit_named(db_collection.name)
         
         return db_collection
 
@@ -213,31 +219,33 @@ class CollectionService:
     ) -> bool:
         """Remove a recipe from a collection."""
         # Verify collection belongs to user
-        collection = self.get_collection_by_id(collection_id, user_id, include_recipes=True)
-        if not collection:
+        owned = self.db.query(
+            exists().where(
+                Collection.id == collection_id,
+                Collection.user_id == user_id
+            )
+        ).scalar()
+        if not owned:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Collection not found"
             )
         
-        # Find and remove recipe from collection
-        recipe_to_remove = None
-        for recipe in collection.recipes:
-            if recipe.id == recipe_id:
-                recipe_to_remove = recipe
-                break
-        
-        if recipe_to_remove:
-            collection.recipes.remove(recipe_to_remove)
-            self.db.commit()
-            return True
+        # Delete the association row directly instead of loading every recipe
+        result = self.db.execute(
+            delete(collection_recipes).where(
+                collection_recipes.c.collection_id == collection_id,
+                collection_recipes.c.recipe_id == recipe_id
+            )
+        )
+        self.db.commit()
         
-        return False
+        return result.rowcount > 0
 
     def count_user_collections(self, user_id: str) -> int:
         """Count total collections for a user."""
         return (
-            self.db.query(Collection)
+            self.db.query(func.count(Collection.id))
             .filter(Collection.user_id == user_id)
-            .count()
+            .scalar()
         )
\ No newline at end of file
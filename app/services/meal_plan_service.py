@@ -1,8 +1,14 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, selectinload, raiseload, load_only
+from sqlalchemy import and_, or_, case, delete, insert, update
 from typing import List, Optional
+from app.core.database import commit_without_expiry
 from app.models.meal_plan import MealPlan, MealPlanEntry
-from app.schemas.meal_plan import MealPlanCreate, MealPlanUpdate
+from app.models.recipe import Recipe
+from app.schemas.meal_plan import MealPlanCreate, MealPlanUpdate, MealPlanEntryCreate
+from pydantic import TypeAdapter
+
+# Dumps a whole list of entries in one pydantic-core call
+_ENTRY_LIST_ADAPTER = TypeAdapter(List[MealPlanEntryCreate])
 
 class MealPlanService:
     def __init__(self, db: Session):
@@ -14,7 +20,11 @@ class MealPlanService:
         skip: int = 0,
         limit: int = 100
     ) -> List[MealPlan]:
-        return self.db.query(MealPlan).filter(
+        # Entries are serialized with each plan; anything else must be loaded explicitly
+        return self.db.query(MealPlan).options(
+            selectinload(MealPlan.entries),
+            raiseload("*")
+        ).filter(
             MealPlan.user_id == user_id
         ).offset(skip).limit(limit).all()
 
@@ -24,18 +34,15 @@ class MealPlanService:
         ).first()
 
     def create_meal_plan(self, meal_plan_data: MealPlanCreate, user_id: str) -> MealPlan:
-        meal_plan_dict = meal_plan_data.dict(exclude={'entries'})
+        meal_plan_dict = meal_plan_data.model_dump(exclude={'entries'})
         meal_plan = MealPlan(**meal_plan_dict, user_id=user_id)
         
         self.db.add(meal_plan)
         self.db.flush()
 
-        for entry_data in meal_plan_data.entries:
-            entry = MealPlanEntry(**entry_data.dict(), meal_plan_id=meal_plan.id)
-            self.db.add(entry)
+        self._insert_entries(meal_plan.id, meal_plan_data.entries)
 
-        self.db.commit()
-        self.db.refresh(meal_plan)
+        commit_without_expiry(self.db)
         return meal_plan
 
     def update_meal_plan(
@@ -48,22 +55,33 @@ class MealPlanService:
         if not meal_plan:
             return None
 
-        update_data = meal_plan_update.dict(exclude_unset=True, exclude={'entries'})
+        update_data = meal_plan_update.model_dump(exclude_unset=True, exclude={'entries'})
         for field, value in update_data.items():
             setattr(meal_plan, field, value)
 
         if meal_plan_update.entries is not None:
-            for entry in meal_plan.entries:
-                self.db.delete(entry)
-            
-            for entry_data in meal_plan_update.entries:
-                entry = MealPlanEntry(**entry_data.dict(), meal_plan_id=meal_plan.id)
-                self.db.add(entry)
+            self.db.execute(
+                delete(MealPlanEntry).where(MealPlanEntry.meal_plan_id == meal_plan.id)
+            )
+            self._insert_entries(meal_plan.id, meal_plan_update.entries)
+            # Entries were replaced outside the ORM; reload them on next access
+            self.db.expire(meal_plan, ['entries'])
 
-        self.db.commit()
-        self.db.refresh(meal_plan)
+        commit_without_expiry(self.db)
         return meal_plan
 
+    def _insert_entries(self, meal_plan_id: str, entries: List[MealPlanEntryCreate]) -> None:
+        """Insert all entries for a meal plan in a single multi-row INSERT."""
+        if not entries:
+            return
+
+        # ORM bulk insert: no MealPlanEntry instances are built, so mapper/session
+        # events on MealPlanEntry (if any are added later) will not fire here.
+        rows = _ENTRY_LIST_ADAPTER.dump_python(entries)
+        for row in rows:
+            row["meal_plan_id"] = meal_plan_id
+        self.db.execute(insert(MealPlanEntry), rows)
+
     def delete_meal_plan(self, meal_plan_id: str, user_id: str) -> bool:
         meal_plan = self.get_meal_plan(meal_plan_id, user_id)
         if not meal_plan:
@@ -76,7 +94,11 @@ class MealPlanService:
     def get_active_meal_plan(self, user_id: str) -> Optional[MealPlan]:
         """Get the user's currently active meal plan with recipe details."""
         return self.db.query(MealPlan).options(
-            joinedload(MealPlan.entries).joinedload(MealPlanEntry.recipe)
+            # Only the columns RecipeDetails serializes; skips the large JSONB fields
+            selectinload(MealPlan.entries).selectinload(MealPlanEntry.recipe).load_only(
+                Recipe.id, Recipe.title, Recipe.media, Recipe.source_url
+            ),
+            raiseload("*")
         ).filter(
             and_(MealPlan.user_id == user_id, MealPlan.is_active == True)
         ).first()
@@ -88,14 +110,18 @@ class MealPlanService:
         if not meal_plan:
             return None
 
-        # Deactivate any currently active meal plan for this user
-        current_active = self.get_active_meal_plan(user_id)
-        if current_active and current_active.id != meal_plan_id:
-            current_active.is_active = False
-
-        # Set the new meal plan as active
-        meal_plan.is_active = True
+        # Flip the active flag for all of the user's plans in one statement
+        self.db.execute(
+            update(MealPlan)
+            .where(
+                MealPlan.user_id == user_id,
+                or_(MealPlan.is_active == True, MealPlan.id == meal_plan_id)
+            )
+            .values(is_active=case((MealPlan.id == meal_plan_id, True), else_=False))
+            .execution_options(synchronize_session=False)
+        )
         
         self.db.commit()
+        # The UPDATE bypassed the ORM, so the loaded is_active value is stale
         self.db.refresh(meal_plan)
         return meal_plan
\ No newline at end of file
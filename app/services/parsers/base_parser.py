@@ -10,6 +10,24 @@ except ImportError:
     SQLALCHEMY_AVAILABLE = False
     Session = None
 
+# Compiled once; these run for every parsed duration/yield
+_ISO_HOURS = re.compile(r'(\d+)H')
+_ISO_MINUTES = re.compile(r'(\d+)M')
+_FIRST_INT = re.compile(r'(\d+)')
+
+
+def _count_li_up_to(html: str, cap: int = 3) -> int:
+    """Count '<li>' occurrences, stopping once cap is reached"""
+    count = 0
+    idx = 0
+    while count < cap:
+        idx = html.find('<li>', idx)
+        if idx < 0:
+            break
+        count += 1
+        idx += 4
+    return count
+
 
 class ParsedRecipe(BaseModel):
     """Data structure for parsed recipe data"""
@@ -47,14 +65,18 @@ class BaseParser(ABC):
         # Parse ISO 8601 duration (PT15M) or simple formats
         if duration_str.startswith('PT'):
             # ISO 8601 format
-            match = re.search(r'(\d+)H', duration_str)
-            hours = int(match.group(1)) if match else 0
-            match = re.search(r'(\d+)M', duration_str)
-            minutes = int(match.group(1)) if match else 0
+            hours = 0
+            if 'H' in duration_str:
+                match = _ISO_HOURS.search(duration_str)
+                hours = int(match.group(1)) if match else 0
+            minutes = 0
+            if 'M' in duration_str:
+                match = _ISO_MINUTES.search(duration_str)
+                minutes = int(match.group(1)) if match else 0
             return hours * 60 + minutes
         
         # Try to extract number from string
-        match = re.search(r'(\d+)', str(duration_str))
+        match = _FIRST_INT.search(str(duration_str))
         return int(match.group(1)) if match else None
     
     def _parse_yield(self, yield_data) -> Optional[int]:
@@ -66,7 +88,7 @@ class BaseParser(ABC):
             return int(yield_data)
         
         if isinstance(yield_data, str):
-            match = re.search(r'(\d+)', yield_data)
+            match = _FIRST_INT.search(yield_data)
             return int(match.group(1)) if match else None
         
         return None
@@ -78,13 +100,14 @@ class BaseParser(ABC):
         if not instructions_data:
             return instructions
         
+        append = instructions.append
         for instruction in instructions_data:
             if isinstance(instruction, str):
-                instructions.append(instruction.strip())
+                append(instruction.strip())
             elif isinstance(instruction, dict):
-                text = instruction.get('text', '') or instruction.get('name', '')
+                text = instruction.get('text') or instruction.get('name')
                 if text:
-                    instructions.append(text.strip())
+                    append(text.strip())
         
         return instructions
     
@@ -95,56 +118,63 @@ class BaseParser(ABC):
         if not ingredients_data:
             return ingredients
         
+        append = ingredients.append
         for ingredient in ingredients_data:
             if isinstance(ingredient, str):
                 # Simple parsing of ingredient string
-                ingredient_text = ingredient.strip()
-                ingredients.append({"name": ingredient_text})
+                append({"name": ingredient.strip()})
             elif isinstance(ingredient, dict):
                 # Structured ingredient data
-                name = ingredient.get('name', ingredient.get('text', ''))
+                name = ingredient.get('name') or ingredient.get('text')
                 if name:
-                    ingredients.append({"name": name.strip()})
+                    append({"name": name.strip()})
         
         return ingredients
     
     def _calculate_confidence_score(self, parsed_data: ParsedRecipe) -> float:
         """Calculate confidence score based on parsed data completeness"""
+        # Read each field once
+        fields = parsed_data.__dict__
+        title = fields.get('title')
+        instructions = fields.get('instructions')
+        ingredients = fields.get('ingredients')
+        description = fields.get('description')
+        
         score = 0.0
         max_score = 100.0
         
         # Title presence and quality
-        if parsed_data.title and len(parsed_data.title.strip()) > 3:
+        if title and len(title.strip()) > 3:
             score += 20
         
         # Instructions presence and quality
-        if isinstance(parsed_data.instructions, str):
+        if isinstance(instructions, str):
             # Count HTML list items to estimate instruction count
-            instruction_count = parsed_data.instructions.count('<li>')
+            instruction_count = _count_li_up_to(instructions)
             if instruction_count >= 3:
                 score += 30
             elif instruction_count >= 1:
                 score += 15
         
         # Ingredients presence and quality
-        if isinstance(parsed_data.ingredients, str):
+        if isinstance(ingredients, str):
             # Count HTML list items to estimate ingredient count
-            ingredient_count = parsed_data.ingredients.count('<li>')
+            ingredient_count = _count_li_up_to(ingredients)
             if ingredient_count >= 3:
                 score += 25
             elif ingredient_count >= 1:
                 score += 10
         
         # Timing information
-        if parsed_data.prep_time or parsed_data.cook_time or parsed_data.total_time:
+        if fields.get('prep_time') or fields.get('cook_time') or fields.get('total_time'):
             score += 10
         
         # Servings information
-        if parsed_data.servings:
+        if fields.get('servings'):
             score += 5
         
         # Description presence
-        if parsed_data.description and len(parsed_data.description.strip()) > 10:
+        if description and len(description.strip()) > 10:
             score += 10
         
         return min(score / max_score, 1.0)
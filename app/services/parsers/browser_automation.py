@@ -4,8 +4,13 @@ Used when traditional HTTP requests fail due to JavaScript requirements or anti-
 """
 import asyncio
 import logging
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Literal, Tuple, Union, TYPE_CHECKING
 from urllib.parse import urlparse
+from app.core.config import settings
 
 if TYPE_CHECKING:
     from playwright.async_api import Browser, BrowserContext, Page
@@ -14,49 +19,357 @@ logger = logging.getLogger(__name__)
 
 try:
     from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Playwright not available: {e}")
     PLAYWRIGHT_AVAILABLE = False
     async_playwright = None
+    PlaywrightTimeoutError = asyncio.TimeoutError
     Browser = None
     BrowserContext = None
     Page = None
 
 
+# Launch browser with realistic settings
+_BROWSER_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-extensions',
+    '--disable-default-apps',
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+]
+
+
+# Phrases that indicate an anti-bot or error page, matched in one pass
+BLOCKING_INDICATORS = (
+    'access denied', 'forbidden', 'blocked',
+    'verify you are human', 'captcha', 'are you a robot',
+    'cloudflare', 'ddos protection', 'rate limit',
+    'security check', 'suspicious activity', 'bot detected',
+    'checking your browser', 'moment please',
+    'error 1020', 'error 1015', 'error 1012',
+    'please enable javascript',
+    'service unavailable', 'temporarily unavailable'
+)
+_BLOCKING_PATTERN = re.compile('|'.join(map(re.escape, BLOCKING_INDICATORS)), re.IGNORECASE)
+
+# Extraction only reads markup and JSON-LD, so these are never worth downloading
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+
+async def _block_heavy_resources(route) -> None:
+    """Route handler: abort images/fonts/media/styles, let documents, scripts and XHR through"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Finds and clicks the first visible "Continue"/"Proceed" control in one round-trip.
+# Mirrors the old query_selector probe order; `:has-text()` is Playwright-only, so
+# text matching is done by hand (case-insensitive substring, like has-text).
+_CLICK_CONTINUE_JS = """
+() => {
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const probes = [
+        ['button', 'continue'], ['button', 'proceed'],
+        ['a', 'continue'], ['a', 'proceed'],
+    ];
+    for (const [tag, text] of probes) {
+        for (const el of document.querySelectorAll(tag)) {
+            if ((el.textContent || '').toLowerCase().includes(text) && visible(el)) {
+                el.click();
+                return `${tag}:has-text("${text}")`;
+            }
+        }
+    }
+    for (const sel of ['[id*="continue"]', '[class*="continue"]']) {
+        const el = document.querySelector(sel);
+        if (el && visible(el)) {
+            el.click();
+            return sel;
+        }
+    }
+    return null;
+}
+"""
+
+# Page is usable once fully loaded or as soon as structured recipe data is present
+_PAGE_READY_JS = (
+    "document.readyState === 'complete' || "
+    "document.querySelector('script[type=\"application/ld+json\"]') !== null"
+)
+
+# Common recipe markers, joined so Playwright waits on all of them at once
+_RECIPE_CONTENT_SELECTOR = ', '.join([
+    'script[type="application/ld+json"]',
+    '[itemprop="recipeIngredient"]',
+    '.recipe-ingredients',
+    '.wprm-recipe',
+    '.recipe-card',
+    '.ingredients',
+    '.recipe'
+])
+
+# Injected into every context before page scripts run to mask automation signals
+_STEALTH_JS = """
+// Remove webdriver property
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined,
+});
+
+// Mock permissions
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: Intl.DateTimeFormat().resolvedOptions().timeZone === 'Asia/Kolkata' ? 'denied' : 'granted' }) :
+        originalQuery(parameters)
+);
+
+// Mock plugins
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5],
+});
+
+// Mock languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en'],
+});
+"""
+
+# Navigation timeout bounds (ms); known domains get 3x their typical load time
+GOTO_TIMEOUT_DEFAULT_MS = 15000
+GOTO_TIMEOUT_MIN_MS = 5000
+GOTO_TIMEOUT_MAX_MS = 30000
+_LATENCY_EWMA_ALPHA = 0.3
+# Domains remembered at once; the least recently navigated is forgotten first
+_DOMAIN_LATENCY_MAX = 2048
+
+# netloc -> exponentially weighted moving average of goto time (ms), in LRU order
+_domain_latency_ms: 'OrderedDict[str, float]' = OrderedDict()
+
+
+def _goto_timeout_ms(domain: str) -> int:
+    ewma = _domain_latency_ms.get(domain)
+    if ewma is None:
+        return GOTO_TIMEOUT_DEFAULT_MS
+    return int(max(GOTO_TIMEOUT_MIN_MS, min(GOTO_TIMEOUT_MAX_MS, 3 * ewma)))
+
+
+def _record_goto_latency(domain: str, elapsed_ms: float) -> None:
+    previous = _domain_latency_ms.get(domain)
+    if previous is None:
+        _domain_latency_ms[domain] = elapsed_ms
+        if len(_domain_latency_ms) > _DOMAIN_LATENCY_MAX:
+            _domain_latency_ms.popitem(last=False)
+    else:
+        _domain_latency_ms[domain] = previous + _LATENCY_EWMA_ALPHA * (elapsed_ms - previous)
+        _domain_latency_ms.move_to_end(domain)
+
+# Raw JSON-LD payloads, collected in the renderer so callers needn't re-parse the HTML
+_JSON_LD_SCRIPTS_JS = (
+    "() => Array.from(document.querySelectorAll('script[type=\"application/ld+json\"]'), "
+    "s => s.textContent || '')"
+)
+
+# Blocking banners sit near the top, so only the first 8KB of rendered text crosses the wire
+_BODY_TEXT_HEAD_JS = "() => document.body ? (document.body.innerText || '').slice(0, 8192) : ''"
+
+
+class BrowserPool:
+    """Pool of long-lived Chromium browsers shared across requests.
+    
+    Launching Chromium costs seconds, so browsers are kept warm and each
+    request only gets a fresh context. A browser is closed and relaunched
+    after `recycle_after` uses to bound memory drift.
+    
+    With `cdp_url` set, the pool connects to an externally managed Chromium
+    over CDP instead of launching its own, so several workers share one
+    browser process; each pooled entry is then a connection to it.
+    """
+    
+    def __init__(self, size: int, recycle_after: int, cdp_url: Optional[str] = None):
+        self.size = size
+        self.recycle_after = recycle_after
+        self.cdp_url = cdp_url
+        self._playwright = None
+        self._available: Optional[asyncio.Queue] = None
+        self._uses: Dict['Browser', int] = {}
+        self._launched = 0
+        self._lock = asyncio.Lock()
+        self._recycle_tasks = set()
+    
+    async def _ensure_started(self) -> None:
+        """Start the Playwright driver on first use"""
+        if self._playwright is not None:
+            return
+        async with self._lock:
+            if self._playwright is None:
+                if not PLAYWRIGHT_AVAILABLE:
+                    raise ImportError("Playwright is required for browser automation. Install with: pip install playwright")
+                self._available = asyncio.Queue()
+                self._playwright = await async_playwright().start()
+    
+    async def _launch(self) -> 'Browser':
+        """Take a free slot and open a browser in it"""
+        self._launched += 1
+        try:
+            return await self._open()
+        except Exception:
+            self._launched -= 1
+            raise
+    
+    async def _open(self) -> 'Browser':
+        """Open a browser for a slot the caller already holds"""
+        if self.cdp_url:
+            browser = await self._playwright.chromium.connect_over_cdp(self.cdp_url)
+        else:
+            browser = await self._playwright.chromium.launch(headless=True, args=_BROWSER_LAUNCH_ARGS)
+        self._uses[browser] = 0
+        return browser
+    
+    async def warm(self) -> None:
+        """Pre-launch browsers up to the pool size"""
+        await self._ensure_started()
+        while self._launched < self.size:
+            self._available.put_nowait(await self._launch())
+        logger.info(f"Browser pool warmed with {self.size} browsers")
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a browser from the pool"""
+        await self._ensure_started()
+        while True:
+            if self._available.empty() and self._launched < self.size:
+                try:
+                    browser = await self._launch()
+                except Exception:
+                    # Hand the free slot to the next waiter instead of leaving it blocked
+                    self._available.put_nowait(None)
+                    raise
+                break
+            browser = await self._available.get()
+            if browser is not None:
+                break
+            # None marks a slot freed by a failed launch; go round and retry it
+        
+        try:
+            yield browser
+        finally:
+            self._uses[browser] = self._uses.get(browser, 0) + 1
+            if self._uses[browser] >= self.recycle_after or not browser.is_connected():
+                task = asyncio.create_task(self._recycle(browser))
+                self._recycle_tasks.add(task)
+                task.add_done_callback(self._recycle_tasks.discard)
+            else:
+                self._available.put_nowait(browser)
+    
+    async def _recycle(self, browser: 'Browser') -> None:
+        """Replace a worn-out browser in the background"""
+        # The slot stays reserved throughout, so acquire() can't launch into it meanwhile
+        self._uses.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing recycled browser: {e}")
+        
+        try:
+            self._available.put_nowait(await self._open())
+        except Exception as e:
+            # Free the slot and wake a waiter so it retries the launch itself
+            logger.error(f"Failed to relaunch pooled browser: {e}")
+            self._launched -= 1
+            self._available.put_nowait(None)
+    
+    async def close(self) -> None:
+        """Close all pooled browsers and stop the driver"""
+        if self._playwright is None:
+            return
+        while not self._available.empty():
+            browser = self._available.get_nowait()
+            if browser is None:
+                continue
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled browser: {e}")
+        self._uses.clear()
+        self._launched = 0
+        await self._playwright.stop()
+        self._playwright = None
+
+
+browser_pool = BrowserPool(
+    settings.BROWSER_POOL_SIZE,
+    settings.BROWSER_POOL_RECYCLE_AFTER,
+    cdp_url=settings.BROWSER_CDP_URL or None
+)
+
+
+async def warm_browser_pool():
+    """FastAPI startup handler: pre-launch pooled browsers"""
+    if not PLAYWRIGHT_AVAILABLE:
+        return
+    try:
+        await browser_pool.warm()
+    except Exception as e:
+        # Browsers are launched lazily on first use instead
+        logger.warning(f"Could not warm browser pool: {e}")
+
+
+async def close_browser_pool():
+    """FastAPI shutdown handler: close pooled browsers"""
+    await browser_pool.close()
+
+
 class BrowserAutomation:
     """Handles browser automation for sites that block traditional scraping"""
     
-    def __init__(self):
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        self.pool = pool or browser_pool
         self.browser: Optional['Browser'] = None
         self.context: Optional['BrowserContext'] = None
-        self._playwright = None
+        self._lease = None
         
     async def __aenter__(self):
         """Async context manager entry"""
         if not PLAYWRIGHT_AVAILABLE:
             raise ImportError("Playwright is required for browser automation. Install with: pip install playwright")
         
-        self._playwright = await async_playwright().start()
-        
-        # Launch browser with realistic settings
-        self.browser = await self._playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--no-first-run',
-                '--no-default-browser-check',
-                '--disable-extensions',
-                '--disable-default-apps',
-                '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
-            ]
-        )
+        try:
+            self.context = await self.new_session()
+        except BaseException:
+            await self._release_browser()
+            raise
         
+        return self
+    
+    async def ensure_browser(self) -> 'Browser':
+        """Borrow a shared browser from the pool if we don't hold one yet"""
+        if self.browser is None:
+            self._lease = self.pool.acquire()
+            self.browser = await self._lease.__aenter__()
+        return self.browser
+    
+    async def new_session(self) -> 'BrowserContext':
+        """Create a new isolated context on the shared browser (cheap, unlike a new browser)"""
+        browser = await self.ensure_browser()
+        return await self._build_context(browser)
+    
+    async def _release_browser(self, exc_type=None, exc_val=None, exc_tb=None) -> None:
+        self.browser = None
+        if self._lease:
+            lease, self._lease = self._lease, None
+            await lease.__aexit__(exc_type, exc_val, exc_tb)
+    
+    async def _build_context(self, browser: 'Browser') -> 'BrowserContext':
+        """Create a fresh browser context with realistic settings"""
         # Create context with realistic settings
-        self.context = await self.browser.new_context(
+        context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
             locale='en-US',
@@ -74,76 +387,95 @@ class BrowserAutomation:
             }
         )
         
+        await context.route("**/*", _block_heavy_resources)
+        
         # Add realistic browser behavior
-        await self.context.add_init_script("""
-            // Remove webdriver property
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined,
-            });
-            
-            // Mock permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Intl.DateTimeFormat().resolvedOptions().timeZone === 'Asia/Kolkata' ? 'denied' : 'granted' }) :
-                    originalQuery(parameters)
-            );
-            
-            // Mock plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-            
-            // Mock languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en'],
-            });
-        """)
+        await context.add_init_script(_STEALTH_JS)
         
-        return self
+        return context
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        """Async context manager exit; closes the context and returns the browser to the pool"""
+        try:
+            if self.context:
+                await self.context.close()
+        finally:
+            self.context = None
+            await self._release_browser(exc_type, exc_val, exc_tb)
     
-    async def fetch_page_content(self, url: str, wait_for_content: bool = True) -> tuple[str, str]:
+    async def fetch_many(
+        self, urls: List[str], wait_for_content: bool = True, concurrency: Optional[int] = None
+    ) -> List[Union[tuple[str, str, List[str]], BaseException]]:
+        """
+        Fetch several pages concurrently, one context per page on the shared browser
+        
+        Returns:
+            list: (page_html, page_title, json_ld_scripts) or the raised exception, in the order of urls
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.pool.size)
+        
+        async def fetch_one(url: str) -> tuple[str, str, List[str]]:
+            async with semaphore:
+                context = await self.new_session()
+                try:
+                    return await self.fetch_page_content(url, wait_for_content, context=context)
+                finally:
+                    await context.close()
+        
+        return await asyncio.gather(*[fetch_one(url) for url in urls], return_exceptions=True)
+    
+    async def fetch_page_content(
+        self, url: str, wait_for_content: bool = True, context: Optional['BrowserContext'] = None
+    ) -> tuple[str, str, List[str]]:
         """
         Fetch page content using browser automation
         
+        Args:
+            context: Browser context to load the page in (defaults to this session's context)
+        
         Returns:
-            tuple: (page_html, page_title)
+            tuple: (page_html, page_title, json_ld_scripts) where json_ld_scripts holds the
+            raw text of every application/ld+json script, read in-page
         """
-        if not self.context:
+        context = context or self.context
+        if not context:
             raise RuntimeError("Browser automation not initialized. Use async context manager.")
         
-        page = await self.context.new_page()
+        page = await context.new_page()
         
         try:
             logger.info(f"Loading page with Playwright: {url}")
             
-            # Navigate to page with realistic timing
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            # Return as soon as the navigation commits; the waits below gate readiness.
+            # Domains with a fast history fail fast instead of holding the browser.
+            domain = urlparse(url).netloc
+            goto_timeout = _goto_timeout_ms(domain)
+            started = time.monotonic()
+            try:
+                await page.goto(url, wait_until='commit', timeout=goto_timeout)
+            except PlaywrightTimeoutError:
+                # Count the timeout as a sample so a domain that slowed down earns a longer one
+                _record_goto_latency(domain, goto_timeout)
+                raise
+            _record_goto_latency(domain, (time.monotonic() - started) * 1000)
             
-            # Wait a bit for any dynamic content
-            await asyncio.sleep(2)
+            # Wait for dynamic content, but only as long as the page needs
+            await self._wait_until_ready(page, timeout=2500)
+            # Readiness can resolve on a JSON-LD <script> in <head>; make sure the body is parsed
+            await page.wait_for_load_state('domcontentloaded')
             
             # Check if we hit a blocking page
-            page_text = await page.text_content('body') or ""
-            if self._is_blocked_page(page_text.lower()):
+            page_text = await page.evaluate(_BODY_TEXT_HEAD_JS)
+            if self._is_blocked_page(page_text):
                 logger.warning(f"Detected blocking page for {url}")
                 
                 # Try some basic evasion techniques
                 await self._try_bypass_techniques(page)
                 
                 # Wait and check again
-                await asyncio.sleep(3)
-                page_text = await page.text_content('body') or ""
-                if self._is_blocked_page(page_text.lower()):
+                await self._wait_until_ready(page, timeout=3000)
+                page_text = await page.evaluate(_BODY_TEXT_HEAD_JS)
+                if self._is_blocked_page(page_text):
                     raise Exception("Page appears to be blocking automated access even with browser automation")
             
             # Wait for recipe-specific content if requested
@@ -153,10 +485,11 @@ class BrowserAutomation:
             # Get final page content
             html_content = await page.content()
             page_title = await page.title()
+            json_ld_scripts = await page.evaluate(_JSON_LD_SCRIPTS_JS)
             
             logger.debug(f"Successfully loaded page: {page_title[:50]}...")
             
-            return html_content, page_title
+            return html_content, page_title, json_ld_scripts
             
         except Exception as e:
             logger.error(f"Browser automation failed for {url}: {e}")
@@ -164,32 +497,21 @@ class BrowserAutomation:
         finally:
             await page.close()
     
+    @staticmethod
+    async def _wait_until_ready(page: 'Page', timeout: int) -> None:
+        """Wait for the page to be ready, giving up silently after timeout ms"""
+        try:
+            await page.wait_for_function(_PAGE_READY_JS, timeout=timeout)
+        except Exception:
+            pass
+    
     async def _wait_for_recipe_content(self, page: 'Page') -> None:
         """Wait for recipe content to load"""
         try:
-            # Wait for common recipe selectors to appear
-            recipe_selectors = [
-                'script[type="application/ld+json"]',
-                '[itemprop="recipeIngredient"]',
-                '.recipe-ingredients',
-                '.wprm-recipe',
-                '.recipe-card',
-                '.ingredients',
-                '.recipe'
-            ]
-            
-            # Try to wait for any recipe content (with timeout)
-            for selector in recipe_selectors:
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    logger.debug(f"Found recipe content: {selector}")
-                    break
-                except:
-                    continue
-            
-            # Wait for any lazy-loaded images
-            await page.wait_for_load_state('networkidle', timeout=10000)
-            
+            # Wait for any common recipe selector; the union resolves on the first match.
+            # 'attached' because the JSON-LD <script> is never visible.
+            await page.wait_for_selector(_RECIPE_CONTENT_SELECTOR, state='attached', timeout=5000)
+            logger.debug("Found recipe content")
         except Exception as e:
             logger.debug(f"Recipe content wait completed with timeout: {e}")
             # Don't fail if we can't find recipe content - page might still be parseable
@@ -197,26 +519,11 @@ class BrowserAutomation:
     async def _try_bypass_techniques(self, page: 'Page') -> None:
         """Try basic techniques to bypass blocking pages"""
         try:
-            # Look for and click "Continue" or similar buttons
-            continue_buttons = [
-                'button:has-text("Continue")',
-                'button:has-text("Proceed")',
-                'a:has-text("Continue")',
-                'a:has-text("Proceed")',
-                '[id*="continue"]',
-                '[class*="continue"]'
-            ]
-            
-            for selector in continue_buttons:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        logger.debug(f"Clicking continue button: {selector}")
-                        await element.click()
-                        await asyncio.sleep(2)
-                        break
-                except:
-                    continue
+            # Look for and click "Continue" or similar buttons (scanned in-page)
+            clicked = await page.evaluate(_CLICK_CONTINUE_JS)
+            if clicked:
+                logger.debug(f"Clicked continue button: {clicked}")
+                await asyncio.sleep(2)
             
             # Try scrolling (some sites require it)
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight/2)")
@@ -230,20 +537,10 @@ class BrowserAutomation:
         except Exception as e:
             logger.debug(f"Bypass techniques failed: {e}")
     
-    def _is_blocked_page(self, page_text: str) -> bool:
-        """Check if page content indicates blocking"""
-        blocking_indicators = [
-            'access denied', 'forbidden', 'blocked',
-            'verify you are human', 'captcha', 'are you a robot',
-            'cloudflare', 'ddos protection', 'rate limit',
-            'security check', 'suspicious activity', 'bot detected',
-            'checking your browser', 'moment please',
-            'error 1020', 'error 1015', 'error 1012',
-            'please enable javascript',
-            'service unavailable', 'temporarily unavailable'
-        ]
-        
-        return any(indicator in page_text for indicator in blocking_indicators)
+    @staticmethod
+    def _is_blocked_page(page_text: str) -> bool:
+        """Check if page content indicates blocking (single case-insensitive scan)"""
+        return _BLOCKING_PATTERN.search(page_text) is not None
     
     async def test_browser_availability(self) -> bool:
         """Test if browser automation is working"""
@@ -252,7 +549,7 @@ class BrowserAutomation:
         
         try:
             async with BrowserAutomation() as browser:
-                html, title = await browser.fetch_page_content("https://httpbin.org/user-agent")
+                html, title, _ = await browser.fetch_page_content("https://httpbin.org/user-agent")
                 return "Mozilla" in html
         except Exception as e:
             logger.error(f"Browser automation test failed: {e}")
@@ -267,7 +564,37 @@ async def get_page_with_browser(url: str) -> tuple[str, str]:
         tuple: (page_html, page_title)
     """
     async with BrowserAutomation() as browser:
-        return await browser.fetch_page_content(url)
+        page_html, page_title, _ = await browser.fetch_page_content(url)
+        return page_html, page_title
+
+
+# Remembered fetch strategy per domain: netloc -> (strategy, recorded_at), in LRU order
+FetchStrategy = Literal["http", "browser"]
+DOMAIN_STRATEGY_TTL_SECONDS = 24 * 3600
+# Domains remembered at once; the least recently used is forgotten first
+_DOMAIN_STRATEGY_MAX = 2048
+_domain_strategy_cache: 'OrderedDict[str, Tuple[FetchStrategy, float]]' = OrderedDict()
+
+
+def get_domain_strategy(domain: str) -> Optional[FetchStrategy]:
+    """How the domain was last fetched successfully, if within the TTL"""
+    entry = _domain_strategy_cache.get(domain)
+    if entry is None:
+        return None
+    strategy, recorded_at = entry
+    if time.time() - recorded_at > DOMAIN_STRATEGY_TTL_SECONDS:
+        del _domain_strategy_cache[domain]
+        return None
+    _domain_strategy_cache.move_to_end(domain)
+    return strategy
+
+
+def set_domain_strategy(domain: str, strategy: FetchStrategy) -> None:
+    """Remember how the domain was fetched successfully"""
+    _domain_strategy_cache[domain] = (strategy, time.time())
+    _domain_strategy_cache.move_to_end(domain)
+    if len(_domain_strategy_cache) > _DOMAIN_STRATEGY_MAX:
+        _domain_strategy_cache.popitem(last=False)
 
 
 # Utility function for testing
@@ -1,5 +1,8 @@
+import asyncio
 import instaloader
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 from .base_parser import BaseParser, ParsedRecipe
@@ -7,6 +10,71 @@ from .text_processor import TextProcessor, RecipePattern
 from app.utils.storage_utils import storage_utils
 from app.utils.media_utils import media_utils
 
+# Instagram URL formats, tried in order
+_SHORTCODE_PATTERNS = tuple(re.compile(p) for p in [
+    # Direct post/reel/tv URLs (old format)
+    r'instagram\.com/p/([^/?]+)',
+    r'instagram\.com/reel/([^/?]+)',
+    r'instagram\.com/tv/([^/?]+)',
+    # User-specific URLs (new format with username in path)
+    r'instagram\.com/([^/]+)/(p|reel|tv)/([^/?]+)',
+    # Stories URLs
+    r'instagram\.com/stories/[^/]+/([^/?]+)',
+])
+
+# Description extraction patterns, applied per caption line
+# Strips hashtags/mentions and collapses the surrounding whitespace in one pass:
+# group 1 is a whitespace run (plus any tags inside it), which becomes one space
+_CLEAN_RE = re.compile(r'(\s(?:\s|#\w+|@\w+)*)|#\w+|@\w+')
+_SERVINGS_RE = re.compile(r'makes?\s+\d+.*servings?|serves?\s+\d+')
+_MEASURE_RE = re.compile(r'\d+\s*(cup|tsp|tbsp|oz|lb|gram)')
+_FALLBACK_MEASURE_RE = re.compile(r'\d+\s*(cup|tsp|tbsp|oz|lb)')
+_FIRST_INT_RE = re.compile(r'(\d+)')
+
+# Keywords suggesting a caption holds a recipe; matched as substrings ("baked" counts as "bake")
+_RECIPE_KEYWORDS = frozenset([
+    'recipe', 'ingredients', 'cook', 'bake', 'preparation',
+    'delicious', 'homemade', 'easy', 'simple', 'tasty',
+    'cup', 'tablespoon', 'teaspoon', 'minutes', 'degrees'
+])
+_RECIPE_KEYWORD_RE = re.compile('|'.join(sorted(_RECIPE_KEYWORDS, key=len, reverse=True)))
+
+# instaloader is synchronous; its HTTP calls run here instead of on the event loop.
+# One worker: an InstaloaderContext (its requests.Session and rate controller) isn't
+# thread-safe, and bursts of GraphQL calls from one session invite 429s and login walls.
+_IG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="instaloader")
+
+# Max posts parsed at once by profile and hashtag scans; their instaloader calls
+# queue on _IG_EXECUTOR while text processing and media storage overlap
+PROFILE_PARSE_CONCURRENCY = 5
+
+# Per post: images stored, and concurrent uploads/thumbnail jobs
+MAX_STORED_IMAGES = 4
+MEDIA_CONCURRENCY = 4
+
+
+def _collapse_clean_match(match: re.Match) -> str:
+    """Replacement for _CLEAN_RE: whitespace runs become one space, tags vanish"""
+    return ' ' if match.group(1) else ''
+
+
+def _fetch_text_parts(post: instaloader.Post, comment_limit: int) -> List[str]:
+    """Read the caption and up to comment_limit comments; both may hit the network"""
+    text_parts = []
+    
+    # Main caption
+    if post.caption:
+        text_parts.append(post.caption)
+    
+    # Comments (first few, if accessible); islice stops the paginated iterator early
+    try:
+        text_parts.extend(comment.text for comment in islice(post.get_comments(), comment_limit))
+    except Exception:
+        # Comments might not be accessible
+        pass
+    
+    return text_parts
+
 
 class InstagramParser(BaseParser):
     """Parser for Instagram posts using instaloader"""
@@ -28,15 +96,17 @@ class InstagramParser(BaseParser):
             if not shortcode:
                 raise ValueError("Invalid Instagram URL format")
             
+            loop = asyncio.get_running_loop()
+            
             # Download post metadata
-            post = self._get_post_data(shortcode)
+            post = await loop.run_in_executor(_IG_EXECUTOR, self._get_post_data, shortcode)
             
             # Validate post object before proceeding
             if not isinstance(post, instaloader.Post):
                 raise Exception(f"Expected Post object, got {type(post)}")
             
             # Extract text content
-            text_content = self._extract_text_content(post)
+            text_content = await self._extract_text_content(post)
             
             # Process text for recipe components
             recipe_pattern = self.text_processor.extract_recipe_from_text(text_content)
@@ -44,7 +114,7 @@ class InstagramParser(BaseParser):
             # Extract servings information from the pattern or text
             servings_count = None
             if recipe_pattern.servings:
-                servings_match = re.search(r'(\d+)', recipe_pattern.servings)
+                servings_match = _FIRST_INT_RE.search(recipe_pattern.servings)
                 if servings_match:
                     servings_count = int(servings_match.group(1))
             
@@ -55,19 +125,13 @@ class InstagramParser(BaseParser):
                 description = "Recipe from Instagram"  # Fallback
             
             # Extract additional metadata
-            media_data = self._extract_media_data(post)
-            
-            # Store media with thumbnails if available
-            await self._process_and_store_media(media_data)
+            media_data = await loop.run_in_executor(_IG_EXECUTOR, self._extract_media_data, post)
             
-            # Generate video thumbnails if this is a video post
-            if post.is_video and media_data.get("video_url"):
-                try:
-                    video_thumbnails = await self._generate_video_thumbnails(media_data["video_url"])
-                    if video_thumbnails:
-                        media_data["video_thumbnails"] = video_thumbnails
-                except Exception as e:
-                    print(f"Failed to generate video thumbnails: {e}")
+            # Store images and generate video thumbnails concurrently
+            await asyncio.gather(
+                self._process_and_store_media(media_data),
+                self._attach_video_thumbnails(media_data, post.is_video)
+            )
             
             # Build parsed recipe with structured data
             parsed_data = ParsedRecipe(
@@ -89,20 +153,8 @@ class InstagramParser(BaseParser):
     
     def _extract_shortcode(self, url: str) -> Optional[str]:
         """Extract Instagram post shortcode from URL"""
-        # Handle various Instagram URL formats
-        patterns = [
-            # Direct post/reel/tv URLs (old format)
-            r'instagram\.com/p/([^/?]+)',
-            r'instagram\.com/reel/([^/?]+)',
-            r'instagram\.com/tv/([^/?]+)',
-            # User-specific URLs (new format with username in path)
-            r'instagram\.com/([^/]+)/(p|reel|tv)/([^/?]+)',
-            # Stories URLs
-            r'instagram\.com/stories/[^/]+/([^/?]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _SHORTCODE_PATTERNS:
+            match = pattern.search(url)
             if match:
                 # For user-specific URLs, return the shortcode (group 3)
                 if len(match.groups()) == 3:
@@ -124,28 +176,11 @@ class InstagramParser(BaseParser):
         except Exception as e:
             raise Exception(f"Failed to fetch Instagram post: {str(e)}")
     
-    def _extract_text_content(self, post: instaloader.Post) -> str:
+    async def _extract_text_content(self, post: instaloader.Post) -> str:
         """Extract all text content from Instagram post"""
-        text_parts = []
-        
-        # Main caption
-        if post.caption:
-            text_parts.append(post.caption)
-        
-        # Comments (first few, if accessible)
-        try:
-            comments = []
-            for comment in post.get_comments():
-                comments.append(comment.text)
-                if len(comments) >= 5:  # Limit to avoid rate limiting
-                    break
-            
-            if comments:
-                text_parts.extend(comments)
-        except:
-            # Comments might not be accessible
-            pass
-        
+        text_parts = await asyncio.get_running_loop().run_in_executor(
+            _IG_EXECUTOR, _fetch_text_parts, post, 5  # Limit comments to avoid rate limiting
+        )
         return "\n".join(text_parts)
     
     def _extract_description_from_post(self, full_text: str) -> str:
@@ -155,17 +190,16 @@ class InstagramParser(BaseParser):
         # Look for the main descriptive paragraph (usually first or second line)
         for line in lines[:5]:
             line = line.strip()
+            line_lower = line.lower()
             # Find long descriptive text that doesn't look like recipe content
             if (len(line) > 30 and 
-                not re.search(r'makes?\s+\d+.*servings?|serves?\s+\d+', line.lower()) and
-                not re.search(r'\d+\s*(cup|tsp|tbsp|oz|lb|gram)', line.lower()) and
-                not line.lower().startswith(('make', 'combine', 'mix', 'add', 'cook', 'bake')) and
+                not _SERVINGS_RE.search(line_lower) and
+                not _MEASURE_RE.search(line_lower) and
+                not line_lower.startswith(('make', 'combine', 'mix', 'add', 'cook', 'bake')) and
                 '#' in line):  # Instagram descriptions often have hashtags
                 
                 # Remove hashtags and mentions for cleaner description
-                clean_line = re.sub(r'#\w+', '', line)
-                clean_line = re.sub(r'@\w+', '', clean_line)
-                clean_line = re.sub(r'\s+', ' ', clean_line).strip()
+                clean_line = _CLEAN_RE.sub(_collapse_clean_match, line).strip()
                 
                 # Truncate if too long
                 if len(clean_line) > 200:
@@ -177,7 +211,7 @@ class InstagramParser(BaseParser):
         for line in lines[:3]:
             line = line.strip()
             if (len(line) > 20 and 
-                not re.search(r'\d+\s*(cup|tsp|tbsp|oz|lb)', line.lower()) and
+                not _FALLBACK_MEASURE_RE.search(line.lower()) and
                 not line.lower().startswith(('ingredients', 'instructions', 'make', 'combine'))):
                 return line[:150] + ("..." if len(line) > 150 else "")
         
@@ -244,76 +278,90 @@ class InstagramParser(BaseParser):
         
         return media_data
     
-    def parse_instagram_profile(self, username: str, max_posts: int = 10) -> List[ParsedRecipe]:
+    async def parse_instagram_profile(self, username: str, max_posts: int = 10) -> List[ParsedRecipe]:
         """Parse multiple recipe posts from an Instagram profile"""
         try:
-            profile = instaloader.Profile.from_username(self.loader.context, username)
-            recipes = []
-            
-            for post in profile.get_posts():
-                if len(recipes) >= max_posts:
-                    break
-                
-                try:
-                    # Check if post might contain a recipe
-                    if self._post_looks_like_recipe(post):
-                        instagram_url = f"https://www.instagram.com/p/{post.shortcode}/"
-                        recipe = self.parse(instagram_url)
-                        
-                        # Only add if confidence is reasonable
-                        if recipe.confidence_score > 0.3:
-                            recipes.append(recipe)
-                            
-                except Exception:
-                    # Skip posts that fail to parse
-                    continue
+            # Walking the post feed is paginated HTTP, so collect candidates off the loop
+            urls = await asyncio.get_running_loop().run_in_executor(
+                _IG_EXECUTOR, self._collect_profile_candidates, username, max_posts
+            )
             
-            return recipes
+            # Only keep reasonable confidence
+            return await self._parse_candidates(urls, min_confidence=0.3)
             
         except Exception as e:
             raise Exception(f"Failed to parse Instagram profile: {str(e)}")
     
+    def _collect_profile_candidates(self, username: str, max_posts: int) -> List[str]:
+        """Collect URLs of up to max_posts profile posts that look like recipes"""
+        profile = instaloader.Profile.from_username(self.loader.context, username)
+        return self._collect_candidate_urls(profile.get_posts(), max_posts)
+    
+    def _collect_hashtag_candidates(self, hashtag: str, max_posts: int) -> List[str]:
+        """Collect URLs of up to max_posts hashtag posts that look like recipes"""
+        hashtag_obj = instaloader.Hashtag.from_name(self.loader.context, hashtag)
+        return self._collect_candidate_urls(hashtag_obj.get_posts(), max_posts)
+    
+    def _collect_candidate_urls(self, posts, max_posts: int) -> List[str]:
+        """Walk a post iterator until max_posts recipe-looking posts are found"""
+        urls = []
+        
+        for post in posts:
+            if len(urls) >= max_posts:
+                break
+            
+            try:
+                # Check if post might contain a recipe
+                if self._post_looks_like_recipe(post):
+                    urls.append(f"https://www.instagram.com/p/{post.shortcode}/")
+            except Exception:
+                continue
+        
+        return urls
+    
+    async def _parse_candidates(self, urls: List[str], min_confidence: float) -> List[ParsedRecipe]:
+        """Parse candidate posts concurrently, keeping those above min_confidence"""
+        semaphore = asyncio.Semaphore(PROFILE_PARSE_CONCURRENCY)
+        
+        async def bounded_parse(url: str) -> ParsedRecipe:
+            async with semaphore:
+                return await self.parse(url)
+        
+        results = await asyncio.gather(
+            *(bounded_parse(url) for url in urls), return_exceptions=True
+        )
+        
+        # Skip posts that failed to parse
+        return [
+            recipe for recipe in results
+            if not isinstance(recipe, BaseException) and recipe.confidence_score > min_confidence
+        ]
+    
     def _post_looks_like_recipe(self, post: instaloader.Post) -> bool:
         """Quick check if post might contain a recipe"""
         if not post.caption:
             return False
         
-        caption_lower = post.caption.lower()
-        
-        # Look for recipe-related keywords
-        recipe_keywords = [
-            'recipe', 'ingredients', 'cook', 'bake', 'preparation',
-            'delicious', 'homemade', 'easy', 'simple', 'tasty',
-            'cup', 'tablespoon', 'teaspoon', 'minutes', 'degrees'
-        ]
-        
-        keyword_count = sum(1 for keyword in recipe_keywords if keyword in caption_lower)
+        # Look for recipe-related keywords in one scan, stopping at the second distinct hit
+        found = set()
+        for match in _RECIPE_KEYWORD_RE.finditer(post.caption.lower()):
+            found.add(match.group())
+            if len(found) >= 2:
+                break
+        keyword_count = len(found)
         
         # Must have at least 2 recipe keywords and reasonable length
         return keyword_count >= 2 and len(post.caption.split()) >= 20
     
-    def search_recipe_hashtags(self, hashtag: str, max_posts: int = 20) -> List[ParsedRecipe]:
+    async def search_recipe_hashtags(self, hashtag: str, max_posts: int = 20) -> List[ParsedRecipe]:
         """Search for recipes using hashtags"""
         try:
-            hashtag_obj = instaloader.Hashtag.from_name(self.loader.context, hashtag)
-            recipes = []
-            
-            for post in hashtag_obj.get_posts():
-                if len(recipes) >= max_posts:
-                    break
-                
-                try:
-                    if self._post_looks_like_recipe(post):
-                        instagram_url = f"https://www.instagram.com/p/{post.shortcode}/"
-                        recipe = self.parse(instagram_url)
-                        
-                        if recipe.confidence_score > 0.4:  # Higher threshold for hashtag searches
-                            recipes.append(recipe)
-                            
-                except Exception:
-                    continue
+            urls = await asyncio.get_running_loop().run_in_executor(
+                _IG_EXECUTOR, self._collect_hashtag_candidates, hashtag, max_posts
+            )
             
-            return recipes
+            # Higher threshold for hashtag searches
+            return await self._parse_candidates(urls, min_confidence=0.4)
             
         except Exception as e:
             raise Exception(f"Failed to search hashtag {hashtag}: {str(e)}")
@@ -340,29 +388,78 @@ class InstagramParser(BaseParser):
     
     async def _process_and_store_media(self, media_data: Dict[str, Any]) -> None:
         """Process and store media (images/videos) with thumbnails"""
-        if media_data.get("images"):
-            try:
-                # Store the primary image/thumbnail
-                primary_image = media_data["images"][0]
-                if primary_image.get("url"):
-                    storage_result = await storage_utils.store_media_from_url(
-                        primary_image["url"],
-                        recipe_id=None  # Will be set later when recipe is saved
-                    )
-                    
-                    if storage_result.get("success"):
-                        # Add stored media info to media_data
-                        media_data["stored_media"] = {
-                            "media_id": storage_result["media_id"],
-                            "thumbnails": {
-                                "small": storage_utils.get_thumbnail_url(storage_result["media_id"], "small"),
-                                "medium": storage_utils.get_thumbnail_url(storage_result["media_id"], "medium"),
-                                "large": storage_utils.get_thumbnail_url(storage_result["media_id"], "large")
-                            },
-                            "original": storage_utils.get_original_url(storage_result["media_id"])
-                        }
-            except Exception as e:
-                print(f"Failed to store media for Instagram post: {e}")
+        urls = [image["url"] for image in media_data["images"][:MAX_STORED_IMAGES] if image.get("url")]
+        if not urls:
+            return
+        
+        semaphore = asyncio.Semaphore(MEDIA_CONCURRENCY)
+        
+        async def store(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await storage_utils.store_media_from_url(
+                    url,
+                    recipe_id=None  # Will be set later when recipe is saved
+                )
+        
+        results = await asyncio.gather(*(store(url) for url in urls), return_exceptions=True)
+        
+        stored_images = []
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"Failed to store media for Instagram post: {result}")
+            elif result.get("success"):
+                stored_images.append(self._stored_media_info(result["media_id"]))
+        
+        # Add stored media info to media_data; stored_media stays the primary image
+        if results and isinstance(results[0], dict) and results[0].get("success"):
+            media_data["stored_media"] = stored_images[0]
+        if stored_images:
+            media_data["stored_images"] = stored_images
+    
+    @staticmethod
+    def _stored_media_info(media_id: str) -> Dict[str, Any]:
+        """Thumbnail and original URLs for a stored media item"""
+        return {
+            "media_id": media_id,
+            "thumbnails": {
+                "small": storage_utils.get_thumbnail_url(media_id, "small"),
+                "medium": storage_utils.get_thumbnail_url(media_id, "medium"),
+                "large": storage_utils.get_thumbnail_url(media_id, "large")
+            },
+            "original": storage_utils.get_original_url(media_id)
+        }
+    
+    async def _attach_video_thumbnails(self, media_data: Dict[str, Any], is_video: bool) -> None:
+        """Generate thumbnails for the post video and any sidecar videos concurrently"""
+        # Sidecar image for each video, or None for the post's own video
+        targets = []
+        video_urls = []
+        if is_video and media_data.get("video_url"):
+            targets.append(None)
+            video_urls.append(media_data["video_url"])
+        for image in media_data["images"]:
+            if image.get("video_url"):
+                targets.append(image)
+                video_urls.append(image["video_url"])
+        
+        if not video_urls:
+            return
+        
+        semaphore = asyncio.Semaphore(MEDIA_CONCURRENCY)
+        
+        async def generate(video_url: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._generate_video_thumbnails(video_url)
+        
+        results = await asyncio.gather(*(generate(url) for url in video_urls))
+        
+        for target, video_thumbnails in zip(targets, results):
+            if not video_thumbnails:
+                continue
+            if target is None:
+                media_data["video_thumbnails"] = video_thumbnails
+            else:
+                target["video_thumbnails"] = video_thumbnails
     
     async def _generate_video_thumbnails(self, video_url: str) -> Optional[Dict[str, Any]]:
         """Generate thumbnails for video posts"""
@@ -1,7 +1,9 @@
 import re
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Iterable, List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from .text_processor import TextProcessor, RecipePattern
+from app.core.config import settings
 
 try:
     import spacy
@@ -11,18 +13,117 @@ except ImportError:
     spacy = None
 
 
-@dataclass
+# Compiled once at import; tried in order, first match wins
+_QUANTITY_PATTERNS = tuple(re.compile(p) for p in [
+    r'(\d+(?:\.\d+)?)\s*-?\s*(\d+(?:\.\d+)?)?',  # 1-2, 1.5, etc.
+    r'(\d+)\s*/\s*(\d+)',  # 1/2, 3/4
+    r'(half|quarter|third)',  # word numbers
+    r'(a\s+few|several|some|handful)',  # approximate quantities
+])
+
+# Quantity at the start of a line, for the combined ingredient pattern
+_LEADING_QUANTITY = (
+    r'\d+\s+\d+\s*/\s*\d+'  # 1 1/2
+    r'|\d+\s*/\s*\d+'  # 1/2, 3/4
+    r'|\d+(?:\.\d+)?(?:\s*-\s*\d+(?:\.\d+)?)?'  # 1-2, 1.5, etc.
+    r'|(?:half|quarter|third|a\s+few|several|some|handful)\b'
+)
+
+_INSTRUCTION_TEMP_PATTERNS = tuple(re.compile(p) for p in [
+    r'(\d+)\s*°?\s*f',  # 350°F, 350 F
+    r'(\d+)\s*degrees?\s*f',  # 350 degrees F
+    r'(\d+)\s*°?\s*c',  # 180°C
+])
+
+_DURATION_PATTERNS = tuple(re.compile(p) for p in [
+    r'(\d+(?:-\d+)?)\s*minutes?',
+    r'(\d+(?:-\d+)?)\s*hours?',
+    r'(\d+)\s*-\s*(\d+)\s*min',
+    r'for\s+(\d+(?:-\d+)?)\s*(?:minutes?|mins?|hours?|hrs?)',
+    r'until\s+\w+',  # "until golden"
+])
+
+_COOKING_TIME_PATTERNS = tuple(re.compile(p) for p in [
+    r'total\s+time:?\s*(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)',
+    r'cooking\s+time:?\s*(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)',
+    r'takes?\s+(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)',
+    r'ready\s+in\s+(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)'
+])
+
+_TEMPERATURE_PATTERNS = tuple(re.compile(p) for p in [
+    r'(\d+)\s*°?\s*f(?:ahrenheit)?',
+    r'(\d+)\s*degrees?\s*f(?:ahrenheit)?',
+    r'(\d+)\s*°?\s*c(?:elsius)?',
+    r'preheat.*?(\d+)\s*°?\s*[fc]'
+])
+
+SPACY_MODEL_NAME = "en_core_web_sm"
+# Only the tokenizer and tagger are read; the rest is never loaded
+_SPACY_EXCLUDE = ["parser", "ner", "lemmatizer", "attribute_ruler", "senter"]
+
+# Decided on the first extraction and shared by every extractor in the process
+_MODEL_LOAD_ATTEMPTED = False
+_CACHED_NLP = None
+
+
+def _get_spacy_model(model_name: str):
+    """Load a spaCy pipeline; None if spaCy can't build one"""
+    try:
+        # Requires: python -m spacy download en_core_web_sm
+        nlp = spacy.load(model_name, exclude=_SPACY_EXCLUDE)
+    except OSError:
+        try:
+            # Fallback to a tokenizer-only blank model if the package isn't installed
+            nlp = spacy.blank("en")
+        except Exception:
+            # If spaCy can't create even a blank model, disable it
+            nlp = None
+    
+    return nlp
+
+
+# Parsed lines remembered per extractor; recipes repeat lines like "1 tsp salt"
+PARSE_CACHE_SIZE = 4096
+
+
+def _remember(cache: OrderedDict, key: str, value: Any) -> Any:
+    """Store a parsed line, evicting the least recently used past PARSE_CACHE_SIZE"""
+    cache[key] = value
+    if len(cache) > PARSE_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _recall(cache: OrderedDict, key: str) -> Any:
+    """Look up a parsed line and mark it recently used; None on a miss"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+# Left over in front of the name once quantity and unit are cut: "1 can of beans"
+_LEADING_FILLERS = ('of ', ',', '-')
+
+
+def _keyword_alternation(keywords: Iterable[str]) -> re.Pattern:
+    """Compile keywords into one substring-matching alternation, longest first"""
+    return re.compile('|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+
+
+@dataclass(slots=True)
 class EnhancedIngredient:
     """Enhanced ingredient with parsed components"""
     name: str
     quantity: Optional[str] = None
     unit: Optional[str] = None
+    unit_type: Optional[str] = None  # "volume", "weight" or "count"
     preparation: Optional[str] = None  # e.g., "chopped", "diced"
     raw_text: str = ""
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedInstruction:
     """Enhanced instruction with parsed components"""
     text: str
@@ -40,14 +141,11 @@ class NLPExtractor:
         self.text_processor = TextProcessor()
         self.nlp = None  # Will be loaded on first use
         
-        # Enhanced patterns for ingredient parsing
-        self.quantity_patterns = [
-            r'(\d+(?:\.\d+)?)\s*-?\s*(\d+(?:\.\d+)?)?',  # 1-2, 1.5, etc.
-            r'(\d+)\s*/\s*(\d+)',  # 1/2, 3/4
-            r'(half|quarter|third)',  # word numbers
-            r'(a\s+few|several|some|handful)',  # approximate quantities
-        ]
+        # Keyed by the stripped line; callers get copies since results are mutable
+        self._ingredient_cache: OrderedDict = OrderedDict()
+        self._instruction_cache: OrderedDict = OrderedDict()
         
+        # Enhanced patterns for ingredient parsing
         self.unit_patterns = {
             'volume': ['cup', 'cups', 'c', 'tablespoon', 'tablespoons', 'tbsp', 'tsp', 'teaspoon', 'teaspoons', 
                       'ml', 'milliliter', 'milliliters', 'l', 'liter', 'liters', 'fl oz', 'fluid ounce'],
@@ -57,40 +155,47 @@ class NLPExtractor:
                      'can', 'cans', 'jar', 'jars', 'package', 'packages', 'bag', 'bags']
         }
         
-        self.preparation_methods = [
+        # One whole-word alternation over every unit; longest first so "cups" beats "cup"
+        self._unit_types = {
+            unit: unit_type for unit_type, units in self.unit_patterns.items() for unit in units
+        }
+        unit_alternation = '|'.join(map(re.escape, sorted(self._unit_types, key=len, reverse=True)))
+        self._unit_re = re.compile(r'\b(' + unit_alternation + r')\b')
+        
+        self.unit_set = frozenset(self._unit_types)
+        
+        self.preparation_methods = frozenset([
             'chopped', 'diced', 'minced', 'sliced', 'grated', 'shredded', 'crushed',
             'mashed', 'pureed', 'julienned', 'cubed', 'quartered', 'halved',
             'peeled', 'trimmed', 'cleaned', 'washed', 'dried'
-        ]
+        ])
         
-        self.cooking_methods = [
+        self.cooking_methods = frozenset([
             'bake', 'baking', 'roast', 'roasting', 'fry', 'frying', 'sauté', 'sautéing',
             'boil', 'boiling', 'simmer', 'simmering', 'steam', 'steaming', 'grill', 'grilling',
             'broil', 'broiling', 'braise', 'braising', 'stew', 'stewing', 'poach', 'poaching'
-        ]
+        ])
+        
+        # Multi-keyword scanners: one pass finds the leftmost keyword (longest at a tie)
+        self._prep_re = _keyword_alternation(self.preparation_methods)
+        self._cooking_re = _keyword_alternation(self.cooking_methods)
+        
+        # "qty [unit] [prep] name" in one anchored match; covers most ingredient lines
+        self._ingredient_re = re.compile(
+            r'(?P<qty>' + _LEADING_QUANTITY + r')\s*'
+            r'(?:(?P<unit>' + unit_alternation + r')\b\s*)?'
+            r'(?:(?P<prep>' + self._prep_re.pattern + r')\b\s*)?'
+            r'(?P<name>.*)',
+            re.DOTALL
+        )
     
     def _load_spacy_model(self):
-        """Load spaCy model on first use"""
-        if not SPACY_AVAILABLE:
-            self.nlp = None
-            return
-            
-        if self.nlp is None:
-            try:
-                # Try to load English model (requires: python -m spacy download en_core_web_sm)
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                try:
-                    # Fallback to blank model if en_core_web_sm not installed
-                    self.nlp = spacy.blank("en")
-                    # Add basic components
-                    if "tagger" not in self.nlp.pipe_names:
-                        self.nlp.add_pipe("tagger")
-                    if "parser" not in self.nlp.pipe_names:
-                        self.nlp.add_pipe("parser")
-                except Exception:
-                    # If spaCy can't create even a blank model, disable it
-                    self.nlp = None
+        """Load spaCy model on first use (shared by every extractor in the process)"""
+        global _MODEL_LOAD_ATTEMPTED, _CACHED_NLP
+        if not _MODEL_LOAD_ATTEMPTED:
+            _CACHED_NLP = _get_spacy_model(SPACY_MODEL_NAME) if SPACY_AVAILABLE else None
+            _MODEL_LOAD_ATTEMPTED = True
+        self.nlp = _CACHED_NLP
     
     def extract_enhanced_recipe(self, text: str) -> Dict[str, Any]:
         """Extract recipe with enhanced NLP processing"""
@@ -122,15 +227,39 @@ class NLPExtractor:
     
     def _parse_ingredients_with_nlp(self, ingredients: List[str], full_text: str) -> List[EnhancedIngredient]:
         """Parse ingredients using NLP for better component extraction"""
-        enhanced_ingredients = []
-        
-        for ingredient_text in ingredients:
-            enhanced = self._parse_single_ingredient(ingredient_text)
-            enhanced_ingredients.append(enhanced)
-        
-        return enhanced_ingredients
+        lines = [ingredient_text.strip() for ingredient_text in ingredients]
+        
+        # Only lines not parsed before go through spaCy and the regexes
+        parsed = {}
+        misses = []
+        for line in dict.fromkeys(lines):
+            cached = _recall(self._ingredient_cache, line)
+            if cached is None:
+                misses.append(line)
+            else:
+                parsed[line] = cached
+        
+        for line, doc in zip(misses, self._tag_ingredients(misses)):
+            parsed[line] = _remember(self._ingredient_cache, line, self._parse_single_ingredient(line, doc))
+        
+        return [replace(parsed[line]) for line in lines]
+    
+    def _tag_ingredients(self, ingredients: List[str]) -> List[Any]:
+        """Run all ingredient lines through spaCy in batches; None per line if unavailable"""
+        if self.nlp is None or not ingredients:
+            return [None] * len(ingredients)
+        
+        try:
+            return list(self.nlp.pipe(
+                (text.strip().lower() for text in ingredients),
+                batch_size=settings.SPACY_BATCH_SIZE,
+                n_process=settings.SPACY_N_PROCESS
+            ))
+        except Exception:
+            # Regex parsing still works without tags
+            return [None] * len(ingredients)
     
-    def _parse_single_ingredient(self, ingredient_text: str) -> EnhancedIngredient:
+    def _parse_single_ingredient(self, ingredient_text: str, doc: Any = None) -> EnhancedIngredient:
         """Parse a single ingredient into components"""
         original_text = ingredient_text.strip()
         text = original_text.lower()
@@ -142,48 +271,68 @@ class NLPExtractor:
             confidence=0.5
         )
         
-        # Extract quantity
-        quantity_match = None
-        for pattern in self.quantity_patterns:
-            match = re.search(pattern, text)
-            if match:
-                quantity_match = match
-                ingredient.quantity = match.group(0)
-                break
-        
-        # Extract unit
-        for unit_type, units in self.unit_patterns.items():
-            for unit in units:
-                if f" {unit}" in text or text.startswith(unit):
-                    ingredient.unit = unit
+        line_match = self._ingredient_re.match(text)
+        if line_match:
+            # Leading quantity: one match yields every component up to the name
+            quantity_span = line_match.span('qty')
+            unit_span = line_match.span('unit') if line_match.group('unit') else None
+            prep_span = line_match.span('prep') if line_match.group('prep') else None
+            name_start = line_match.start('name')
+        else:
+            # Components may appear anywhere in the line; scan for each
+            quantity_span = unit_span = prep_span = None
+            name_start = 0
+            for pattern in _QUANTITY_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    quantity_span = match.span()
                     break
-            if ingredient.unit:
-                break
-        
-        # Extract preparation method
-        for prep in self.preparation_methods:
-            if prep in text:
-                ingredient.preparation = prep
-                break
+            unit_match = self._unit_re.search(text)
+            if unit_match:
+                unit_span = unit_match.span()
+        
+        if quantity_span:
+            ingredient.quantity = text[quantity_span[0]:quantity_span[1]]
+        if unit_span:
+            ingredient.unit = text[unit_span[0]:unit_span[1]]
+            ingredient.unit_type = self._unit_types[ingredient.unit]
+        
+        # Extract preparation method (often trails the name: "onion, chopped")
+        if prep_span is None:
+            if doc is not None:
+                # Known methods by set lookup per token
+                token = next(
+                    (token for token in doc
+                     if token.idx >= name_start and token.lower_ in self.preparation_methods),
+                    None
+                )
+                if token is not None:
+                    prep_span = (token.idx, token.idx + len(token.text))
+            else:
+                prep_match = self._prep_re.search(text, name_start)
+                if prep_match:
+                    prep_span = prep_match.span()
+        if prep_span:
+            ingredient.preparation = text[prep_span[0]:prep_span[1]]
         
         # Extract ingredient name (what's left after removing quantity, unit, preparation)
         name_text = text
         
-        # Remove quantity
-        if quantity_match:
-            name_text = name_text.replace(quantity_match.group(0), "", 1)
-        
-        # Remove unit
-        if ingredient.unit:
-            name_text = name_text.replace(ingredient.unit, "", 1)
-        
-        # Remove preparation
-        if ingredient.preparation:
-            name_text = name_text.replace(ingredient.preparation, "", 1)
+        # Cut the matches out by position (later span first keeps offsets valid),
+        # so "cup" is never stripped from inside a word like "cupcake"
+        spans = [span for span in (quantity_span, unit_span, prep_span) if span]
+        cut_from = len(name_text)
+        for start, end in sorted(spans, reverse=True):
+            if end <= cut_from:
+                name_text = name_text[:start] + name_text[end:]
+                cut_from = start
         
         # Clean up name
-        name_text = re.sub(r'\s+', ' ', name_text).strip()
-        name_text = re.sub(r'^(of|,|-)', '', name_text).strip()
+        name_text = ' '.join(name_text.split())
+        for filler in _LEADING_FILLERS:
+            if name_text.startswith(filler):
+                name_text = name_text[len(filler):].strip()
+                break
         
         ingredient.name = name_text if name_text else original_text
         
@@ -205,12 +354,15 @@ class NLPExtractor:
         enhanced_instructions = []
         
         for i, instruction_text in enumerate(instructions):
-            enhanced = self._parse_single_instruction(instruction_text, i + 1)
-            enhanced_instructions.append(enhanced)
+            text = instruction_text.strip()
+            cached = _recall(self._instruction_cache, text)
+            if cached is None:
+                cached = _remember(self._instruction_cache, text, self._parse_single_instruction(text, None))
+            enhanced_instructions.append(replace(cached, step_number=i + 1))
         
         return enhanced_instructions
     
-    def _parse_single_instruction(self, instruction_text: str, step_num: int) -> EnhancedInstruction:
+    def _parse_single_instruction(self, instruction_text: str, step_num: Optional[int]) -> EnhancedInstruction:
         """Parse a single instruction into components"""
         text = instruction_text.strip()
         text_lower = text.lower()
@@ -222,35 +374,20 @@ class NLPExtractor:
         )
         
         # Extract cooking method
-        for method in self.cooking_methods:
-            if method in text_lower:
-                instruction.cooking_method = method
-                break
+        method_match = self._cooking_re.search(text_lower)
+        if method_match:
+            instruction.cooking_method = method_match.group(0)
         
         # Extract temperature
-        temp_patterns = [
-            r'(\d+)\s*°?\s*f',  # 350°F, 350 F
-            r'(\d+)\s*degrees?\s*f',  # 350 degrees F
-            r'(\d+)\s*°?\s*c',  # 180°C
-        ]
-        
-        for pattern in temp_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _INSTRUCTION_TEMP_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 instruction.temperature = match.group(0)
                 break
         
         # Extract duration
-        duration_patterns = [
-            r'(\d+(?:-\d+)?)\s*minutes?',
-            r'(\d+(?:-\d+)?)\s*hours?',
-            r'(\d+)\s*-\s*(\d+)\s*min',
-            r'for\s+(\d+(?:-\d+)?)\s*(?:minutes?|mins?|hours?|hrs?)',
-            r'until\s+\w+',  # "until golden"
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _DURATION_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 instruction.duration = match.group(0)
                 break
@@ -272,15 +409,8 @@ class NLPExtractor:
         """Extract total cooking time from text"""
         text_lower = text.lower()
         
-        time_patterns = [
-            r'total\s+time:?\s*(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)',
-            r'cooking\s+time:?\s*(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)',
-            r'takes?\s+(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)',
-            r'ready\s+in\s+(\d+(?:-\d+)?)\s*(minutes?|hours?|mins?|hrs?)'
-        ]
-        
-        for pattern in time_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _COOKING_TIME_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 return {
                     'duration': match.group(1),
@@ -294,15 +424,8 @@ class NLPExtractor:
         """Extract cooking temperature from text"""
         text_lower = text.lower()
         
-        temp_patterns = [
-            r'(\d+)\s*°?\s*f(?:ahrenheit)?',
-            r'(\d+)\s*degrees?\s*f(?:ahrenheit)?',
-            r'(\d+)\s*°?\s*c(?:elsius)?',
-            r'preheat.*?(\d+)\s*°?\s*[fc]'
-        ]
-        
-        for pattern in temp_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _TEMPERATURE_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 return match.group(0)
         
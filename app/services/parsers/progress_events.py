@@ -3,11 +3,13 @@ Progress event system for real-time parsing status updates.
 Provides structured events for streaming parsing progress to frontend.
 """
 import time
-import json
 import asyncio
+import orjson
+from collections import deque
+from itertools import islice
 from enum import Enum
-from typing import Dict, Any, Optional, List, Callable, AsyncGenerator
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Any, Optional, List, Callable, AsyncGenerator, Tuple
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import logging
 
@@ -29,6 +31,28 @@ class ProgressPhase(Enum):
     FAILED = "failed"
 
 
+# Phase order and per-phase tables, built once and indexed by position in _PHASE_LIST
+_PHASE_LIST = tuple(ProgressPhase)
+_PHASE_IDX = {phase: i for i, phase in enumerate(_PHASE_LIST)}
+_TERMINAL_PHASES = frozenset({ProgressPhase.COMPLETED, ProgressPhase.FAILED})
+# Plain dict lookups instead of the Enum.value descriptor on every serialized event
+_PHASE_VALUE = {phase: phase.value for phase in ProgressPhase}
+
+# Overall progress at the start of each phase; None for phases without a fixed weight
+_PHASE_WEIGHT_MAP = {
+    ProgressPhase.INITIALIZING: 5,
+    ProgressPhase.RATE_LIMITING: 10,
+    ProgressPhase.TRYING_SCRAPERS: 25,
+    ProgressPhase.TRYING_MANUAL: 35,
+    ProgressPhase.TRYING_BROWSER: 50,
+    ProgressPhase.PARSING_CONTENT: 85,
+    ProgressPhase.VALIDATING: 95,
+    ProgressPhase.COMPLETED: 100,
+    ProgressPhase.FAILED: 0,
+}
+_PHASE_WEIGHTS = tuple(_PHASE_WEIGHT_MAP.get(phase) for phase in _PHASE_LIST)
+
+
 class ProgressStatus(Enum):
     """Status of current operation"""
     PENDING = "pending"
@@ -39,7 +63,10 @@ class ProgressStatus(Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+_STATUS_VALUE = {status: status.value for status in ProgressStatus}
+
+
+@dataclass(slots=True)
 class ProgressEvent:
     """Structured progress event data"""
     event_id: str
@@ -63,15 +90,24 @@ class ProgressEvent:
     progress_percent: Optional[int] = None
     estimated_remaining_ms: Optional[int] = None
     
+    # Encoded JSON payload, built on first send and reused for every subscriber
+    _json_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
+        payload = self._payload()
+        payload["datetime"] = payload["datetime"].isoformat()
+        return payload
+    
+    def _payload(self) -> Dict[str, Any]:
+        """Event fields with `datetime` left as an object (orjson formats it natively)"""
         return {
             "event_id": self.event_id,
-            "phase": self.phase.value,
-            "status": self.status.value,
+            "phase": _PHASE_VALUE[self.phase],
+            "status": _STATUS_VALUE[self.status],
             "message": self.message,
             "timestamp": self.timestamp,
-            "datetime": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "datetime": datetime.fromtimestamp(self.timestamp),
             "method": self.method,
             "attempt": self.attempt,
             "total_attempts": self.total_attempts,
@@ -83,10 +119,30 @@ class ProgressEvent:
             "estimated_remaining_ms": self.estimated_remaining_ms,
         }
     
+    def _encoded(self) -> bytes:
+        """JSON-encoded payload, cached per event"""
+        if self._json_bytes is None:
+            self._json_bytes = orjson.dumps(self._payload())
+        return self._json_bytes
+    
+    def to_sse_bytes(self) -> bytes:
+        """Format as an encoded Server-Sent Event frame"""
+        return b"data: " + self._encoded() + b"\n\n"
+    
+    def to_ndjson_bytes(self) -> bytes:
+        """Format as one newline-delimited JSON line"""
+        return self._encoded() + b"\n"
+    
     def to_sse_format(self) -> str:
         """Format as Server-Sent Event"""
-        data = json.dumps(self.to_dict())
-        return f"data: {data}\n\n"
+        return self.to_sse_bytes().decode()
+
+
+# Events kept per session for inspection; older ones are dropped
+MAX_STORED_EVENTS = 500
+
+# Events buffered for streaming subscribers; a subscriber further behind skips ahead
+SESSION_BROADCAST_BUFFER = 256
 
 
 class ProgressEventEmitter:
@@ -95,15 +151,21 @@ class ProgressEventEmitter:
     def __init__(self, url: str, session_id: str):
         self.url = url
         self.session_id = session_id
-        self.start_time = time.time()
+        self.start_time = time.time()  # Wall clock, reported in summaries
+        # Durations are measured on the monotonic clock, immune to wall-clock jumps
+        self.start_monotonic = time.monotonic()
         self.event_counter = 0
         self.current_phase = ProgressPhase.INITIALIZING
-        self.events: List[ProgressEvent] = []
-        self.listeners: List[Callable[[ProgressEvent], None]] = []
+        # Recent history only; event_counter keeps the lifetime total
+        self.events: Deque[ProgressEvent] = deque(maxlen=MAX_STORED_EVENTS)
+        # Insertion-ordered set: O(1) add and remove
+        self.listeners: Dict[Callable[[ProgressEvent], None], None] = {}
         
-        # Phase timing for progress estimation
+        # Phase timing for progress estimation (time.monotonic() readings)
         self.phase_start_times: Dict[ProgressPhase, float] = {}
         self.phase_durations: Dict[ProgressPhase, float] = {}
+        # Same durations keyed by phase value, kept in step for get_summary
+        self._phase_durations_by_value: Dict[str, float] = {}
         
         # Expected phase durations (in seconds) for progress estimation
         self.expected_durations = {
@@ -115,15 +177,25 @@ class ProgressEventEmitter:
             ProgressPhase.PARSING_CONTENT: 2.0,
             ProgressPhase.VALIDATING: 1.0,
         }
+        
+        # Expected durations aligned with _PHASE_LIST, plus the expected time left
+        # after each phase (summed up to the first terminal phase)
+        self._expected_by_idx = tuple(
+            self.expected_durations.get(phase, 5.0) for phase in _PHASE_LIST
+        )
+        remaining_after = [0.0] * len(_PHASE_LIST)
+        for i in range(len(_PHASE_LIST) - 2, -1, -1):
+            if _PHASE_LIST[i + 1] not in _TERMINAL_PHASES:
+                remaining_after[i] = self._expected_by_idx[i + 1] + remaining_after[i + 1]
+        self._remaining_after_idx = tuple(remaining_after)
     
     def add_listener(self, listener: Callable[[ProgressEvent], None]) -> None:
         """Add event listener"""
-        self.listeners.append(listener)
+        self.listeners[listener] = None
     
     def remove_listener(self, listener: Callable[[ProgressEvent], None]) -> None:
         """Remove event listener"""
-        if listener in self.listeners:
-            self.listeners.remove(listener)
+        self.listeners.pop(listener, None)
     
     def emit_event(
         self,
@@ -141,18 +213,19 @@ class ProgressEventEmitter:
         
         # Update phase tracking
         current_time = time.time()
+        now = time.monotonic()
         if phase != self.current_phase:
             if self.current_phase in self.phase_start_times:
-                duration = current_time - self.phase_start_times[self.current_phase]
+                duration = now - self.phase_start_times[self.current_phase]
                 self.phase_durations[self.current_phase] = duration
+                self._phase_durations_by_value[_PHASE_VALUE[self.current_phase]] = duration
             
             self.current_phase = phase
-            self.phase_start_times[phase] = current_time
+            self.phase_start_times[phase] = now
         
         # Calculate progress and estimates
-        progress_percent = self._calculate_progress_percent()
-        estimated_remaining = self._estimate_remaining_time()
-        duration_ms = int((current_time - self.start_time) * 1000)
+        progress_percent, estimated_remaining = self._compute_progress(now)
+        duration_ms = int((now - self.start_monotonic) * 1000)
         
         # Create event
         self.event_counter += 1
@@ -177,8 +250,8 @@ class ProgressEventEmitter:
         self.events.append(event)
         logger.debug(f"Progress event: {phase.value} - {message}")
         
-        # Notify listeners
-        for listener in self.listeners:
+        # Notify listeners (snapshot, so a listener may remove itself)
+        for listener in tuple(self.listeners):
             try:
                 listener(event)
             except Exception as e:
@@ -186,70 +259,42 @@ class ProgressEventEmitter:
         
         return event
     
-    def _calculate_progress_percent(self) -> int:
-        """Calculate overall progress percentage"""
-        phase_weights = {
-            ProgressPhase.INITIALIZING: 5,
-            ProgressPhase.RATE_LIMITING: 10,
-            ProgressPhase.TRYING_SCRAPERS: 25,
-            ProgressPhase.TRYING_MANUAL: 35,
-            ProgressPhase.TRYING_BROWSER: 50,
-            ProgressPhase.PARSING_CONTENT: 85,
-            ProgressPhase.VALIDATING: 95,
-            ProgressPhase.COMPLETED: 100,
-            ProgressPhase.FAILED: 0,
-        }
+    def _compute_progress(self, now: float) -> Tuple[int, Optional[int]]:
+        """Overall progress percentage and estimated remaining milliseconds at `now`"""
+        idx = _PHASE_IDX[self.current_phase]
+        weight = _PHASE_WEIGHTS[idx]
+        progress = weight if weight is not None else 0
+        expected = self._expected_by_idx[idx]
         
-        base_progress = phase_weights.get(self.current_phase, 0)
+        phase_start = self.phase_start_times.get(self.current_phase)
+        phase_elapsed = now - phase_start if phase_start is not None else None
         
         # Add sub-progress within current phase if available
-        if self.current_phase in self.phase_start_times:
-            phase_elapsed = time.time() - self.phase_start_times[self.current_phase]
-            expected_duration = self.expected_durations.get(self.current_phase, 5.0)
-            phase_progress = min(1.0, phase_elapsed / expected_duration)
+        if phase_elapsed is not None and idx < len(_PHASE_LIST) - 1:
+            phase_progress = min(1.0, phase_elapsed / expected)
             
-            # Get next phase weight for interpolation
-            phase_list = list(ProgressPhase)
-            current_idx = phase_list.index(self.current_phase)
-            if current_idx < len(phase_list) - 1:
-                next_phase = phase_list[current_idx + 1]
-                next_weight = phase_weights.get(next_phase, base_progress + 10)
-                base_progress += int((next_weight - base_progress) * phase_progress)
-        
-        return min(100, max(0, base_progress))
-    
-    def _estimate_remaining_time(self) -> Optional[int]:
-        """Estimate remaining time in milliseconds"""
-        if self.current_phase in [ProgressPhase.COMPLETED, ProgressPhase.FAILED]:
-            return 0
+            # Interpolate towards the next phase's weight
+            next_weight = _PHASE_WEIGHTS[idx + 1]
+            if next_weight is None:
+                next_weight = progress + 10
+            progress += int((next_weight - progress) * phase_progress)
+        progress = min(100, max(0, progress))
         
-        # Calculate based on expected durations
-        remaining_phases = []
-        phase_list = list(ProgressPhase)
-        current_idx = phase_list.index(self.current_phase)
+        if self.current_phase in _TERMINAL_PHASES:
+            return progress, 0
         
-        # Add remaining time for current phase
-        if self.current_phase in self.phase_start_times:
-            phase_elapsed = time.time() - self.phase_start_times[self.current_phase]
-            expected_duration = self.expected_durations.get(self.current_phase, 5.0)
-            remaining_in_phase = max(0, expected_duration - phase_elapsed)
-            remaining_phases.append(remaining_in_phase)
+        # Expected time of all future phases (precomputed) plus what's left of this one
+        total_remaining = self._remaining_after_idx[idx]
+        if phase_elapsed is not None:
+            total_remaining += max(0, expected - phase_elapsed)
         
-        # Add time for future phases
-        for i in range(current_idx + 1, len(phase_list)):
-            phase = phase_list[i]
-            if phase in [ProgressPhase.COMPLETED, ProgressPhase.FAILED]:
-                break
-            expected = self.expected_durations.get(phase, 5.0)
-            remaining_phases.append(expected)
-        
-        total_remaining = sum(remaining_phases)
-        return int(total_remaining * 1000) if total_remaining > 0 else None
+        return progress, int(total_remaining * 1000) if total_remaining > 0 else None
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of parsing session"""
-        current_time = time.time()
-        total_duration = current_time - self.start_time
+        now = time.monotonic()
+        total_duration = now - self.start_monotonic
+        progress_percent, estimated_remaining = self._compute_progress(now)
         
         return {
             "session_id": self.session_id,
@@ -257,38 +302,51 @@ class ProgressEventEmitter:
             "start_time": self.start_time,
             "total_duration_ms": int(total_duration * 1000),
             "current_phase": self.current_phase.value,
-            "total_events": len(self.events),
-            "progress_percent": self._calculate_progress_percent(),
-            "estimated_remaining_ms": self._estimate_remaining_time(),
-            "phase_durations": {
-                phase.value: duration for phase, duration in self.phase_durations.items()
-            }
+            "total_events": self.event_counter,
+            "progress_percent": progress_percent,
+            "estimated_remaining_ms": estimated_remaining,
+            "phase_durations": dict(self._phase_durations_by_value)
         }
 
 
+class _SessionBroadcast:
+    """Ring buffer of a session's recent events shared by all of its subscribers.
+    
+    Publishing appends once and wakes every waiting subscriber through a single
+    asyncio.Event; each subscriber tracks its own read position by sequence number.
+    """
+    __slots__ = ("ring", "seq", "changed")
+    
+    def __init__(self, maxlen: int):
+        self.ring: Deque[ProgressEvent] = deque(maxlen=maxlen)
+        self.seq = 0  # Sequence number the next published event will get
+        self.changed = asyncio.Event()
+    
+    def publish(self, event: ProgressEvent) -> None:
+        self.ring.append(event)
+        self.seq += 1
+        # Swap in a fresh Event before setting the old one, so every current
+        # waiter wakes and later waiters block until the next publish
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
 class ProgressEventStream:
     """Manages streaming of progress events via Server-Sent Events"""
     
     def __init__(self):
         self.active_sessions: Dict[str, ProgressEventEmitter] = {}
-        self.session_streams: Dict[str, List[asyncio.Queue]] = {}
+        self.session_streams: Dict[str, _SessionBroadcast] = {}
     
     def create_session(self, url: str, session_id: str) -> ProgressEventEmitter:
         """Create new progress tracking session"""
         emitter = ProgressEventEmitter(url, session_id)
         self.active_sessions[session_id] = emitter
-        self.session_streams[session_id] = []
+        broadcast = _SessionBroadcast(SESSION_BROADCAST_BUFFER)
+        self.session_streams[session_id] = broadcast
         
-        # Add listener to forward events to streams
-        def forward_to_streams(event: ProgressEvent):
-            if session_id in self.session_streams:
-                for queue in self.session_streams[session_id]:
-                    try:
-                        queue.put_nowait(event)
-                    except asyncio.QueueFull:
-                        logger.warning(f"Progress event queue full for session {session_id}")
-        
-        emitter.add_listener(forward_to_streams)
+        # Forward events to every subscriber with one append
+        emitter.add_listener(broadcast.publish)
         return emitter
     
     def get_session(self, session_id: str) -> Optional[ProgressEventEmitter]:
@@ -297,34 +355,42 @@ class ProgressEventStream:
     
     async def subscribe_to_session(self, session_id: str) -> AsyncGenerator[ProgressEvent, None]:
         """Subscribe to progress events for a session"""
-        if session_id not in self.session_streams:
+        broadcast = self.session_streams.get(session_id)
+        if broadcast is None:
             return
         
-        queue = asyncio.Queue(maxsize=100)
-        self.session_streams[session_id].append(queue)
+        # Only events published after subscribing are delivered
+        cursor = broadcast.seq
         
         try:
             while True:
-                try:
-                    # Wait for next event with timeout
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
+                if cursor == broadcast.seq:
+                    try:
+                        # Wait for next event with timeout
+                        await asyncio.wait_for(broadcast.changed.wait(), timeout=30.0)
+                    except asyncio.TimeoutError:
+                        # Send keepalive
+                        continue
+                
+                first = broadcast.seq - len(broadcast.ring)
+                if cursor < first:
+                    logger.warning(
+                        f"Progress subscriber fell behind for session {session_id}; "
+                        f"skipped {first - cursor} events"
+                    )
+                    cursor = first
+                
+                # Snapshot: the ring may change while this generator is suspended
+                for event in list(islice(broadcast.ring, cursor - first, None)):
+                    cursor += 1
                     yield event
                     
                     # Stop streaming if session is complete
-                    if event.phase in [ProgressPhase.COMPLETED, ProgressPhase.FAILED]:
-                        break
-                        
-                except asyncio.TimeoutError:
-                    # Send keepalive
-                    continue
+                    if event.phase in _TERMINAL_PHASES:
+                        return
                     
         except asyncio.CancelledError:
             pass
-        finally:
-            # Cleanup
-            if session_id in self.session_streams:
-                if queue in self.session_streams[session_id]:
-                    self.session_streams[session_id].remove(queue)
     
     def cleanup_session(self, session_id: str):
         """Clean up completed session"""
@@ -3,15 +3,85 @@ Utilities for handling HTTP requests with anti-bot protection evasion.
 Contains defensive strategies for bypassing website blocking mechanisms.
 """
 import random
+import re
 import time
 import asyncio
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+import heapq
+import itertools
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _domain_of(url: str) -> str:
+    """netloc of a URL, memoized since every request looks it up several times"""
+    return urlsplit(url).netloc
+
+
+_CHROME_VERSION_RE = re.compile(r'Chrome/(\d+)')
+
+_SEC_CH_UA_BY_VERSION = {
+    "119": '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"',
+    "118": '"Google Chrome";v="118", "Chromium";v="118", "Not=A?Brand";v="99"',
+    "117": '"Google Chrome";v="117", "Chromium";v="117", "Not;A=Brand";v="8"',
+}
+_DEFAULT_SEC_CH_UA = '"Chromium";v="119", "Not?A_Brand";v="24"'
+
+
+def _sec_ch_ua(user_agent: str) -> str:
+    """Generate sec-ch-ua header based on user agent"""
+    match = _CHROME_VERSION_RE.search(user_agent)
+    return _SEC_CH_UA_BY_VERSION.get(match.group(1) if match else None, _DEFAULT_SEC_CH_UA)
+
+
+def _platform_from_ua(user_agent: str) -> str:
+    """Extract platform for sec-ch-ua-platform header"""
+    if "Windows" in user_agent:
+        return '"Windows"'
+    elif "Macintosh" in user_agent:
+        return '"macOS"'
+    elif "Linux" in user_agent:
+        return '"Linux"'
+    else:
+        return '"Unknown"'
+
+
+_HeaderPairs = Tuple[Tuple[str, str], ...]
+
+# Fetch metadata sent by Chrome, for direct and referred navigations
+_FETCH_HEADERS = (
+    ("Sec-Fetch-Dest", "document"),
+    ("Sec-Fetch-Mode", "navigate"),
+    ("Sec-Fetch-Site", "none"),
+    ("Sec-Fetch-User", "?1"),
+)
+_REFERRED_FETCH_HEADERS = (
+    ("Sec-Fetch-Dest", "document"),
+    ("Sec-Fetch-Mode", "navigate"),
+    ("Sec-Fetch-Site", "same-origin"),
+    ("Sec-Fetch-User", "?1"),
+)
+
+
+def _ua_profile(user_agent: str) -> Tuple[str, _HeaderPairs, _HeaderPairs]:
+    """User agent with the extra headers it sends on direct and referred navigations"""
+    if "Chrome" not in user_agent:
+        return user_agent, (), ()
+    
+    client_hints = (
+        ("sec-ch-ua", _sec_ch_ua(user_agent)),
+        ("sec-ch-ua-mobile", "?0"),
+        ("sec-ch-ua-platform", _platform_from_ua(user_agent)),
+    )
+    return user_agent, client_hints + _FETCH_HEADERS, client_hints + _REFERRED_FETCH_HEADERS
+
+
 class RequestHeaderManager:
     """Manages rotating headers and user agents for defensive web scraping"""
     
@@ -47,6 +117,16 @@ class RequestHeaderManager:
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
     ]
     
+    # (user agent, extra headers when direct, extra headers when referred), derived once
+    _UA_PROFILES = tuple(_ua_profile(ua) for ua in USER_AGENTS)
+    
+    # Fixed headers, copied into each request's dict as prebuilt pairs
+    _BASE_HEADERS = (
+        ("DNT", "1"),  # Do Not Track
+        ("Connection", "keep-alive"),
+        ("Upgrade-Insecure-Requests", "1"),
+    )
+    
     # Common languages weighted by usage
     ACCEPT_LANGUAGES = [
         "en-US,en;q=0.9",
@@ -71,61 +151,50 @@ class RequestHeaderManager:
     ]
     
     def __init__(self):
-        self._last_user_agent_index = 0
+        self._ua_cycle = itertools.cycle(self._UA_PROFILES)
         
     def get_random_headers(self, url: str = None, referrer: str = None) -> Dict[str, str]:
         """Generate realistic browser headers with rotation"""
-        user_agent = self._get_next_user_agent()
+        # One draw feeds every random decision below: three 8-bit fields compared
+        # against thresholds (x/256) and four 16-bit fields reduced to list indexes
+        bits = random.getrandbits(88)
+        
+        user_agent, direct_extras, referred_extras = self._get_next_user_agent(bits)
         
         headers = {
             "User-Agent": user_agent,
-            "Accept": random.choice(self.ACCEPT_HEADERS),
-            "Accept-Language": random.choice(self.ACCEPT_LANGUAGES),
-            "Accept-Encoding": random.choice(self.ACCEPT_ENCODINGS),
-            "DNT": "1",  # Do Not Track
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
+            "Accept": self.ACCEPT_HEADERS[(bits >> 24 & 0xFFFF) % len(self.ACCEPT_HEADERS)],
+            "Accept-Language": self.ACCEPT_LANGUAGES[(bits >> 40 & 0xFFFF) % len(self.ACCEPT_LANGUAGES)],
+            "Accept-Encoding": self.ACCEPT_ENCODINGS[(bits >> 56 & 0xFFFF) % len(self.ACCEPT_ENCODINGS)],
         }
+        headers.update(self._BASE_HEADERS)
         
-        # Add cache control occasionally
-        if random.random() < 0.3:
+        # Add cache control occasionally (77/256, ~30%)
+        if bits & 0xFF < 77:
             headers["Cache-Control"] = "no-cache"
         
         # Add referrer if provided or generate realistic one
         if referrer:
             headers["Referer"] = referrer
-        elif url and random.random() < 0.4:  # 40% chance of adding referrer
+        elif url and bits >> 8 & 0xFF < 102:  # 102/256, ~40% chance of adding referrer
             headers["Referer"] = self._generate_realistic_referrer(url)
         
         # Add sec headers for Chrome-like behavior
-        if "Chrome" in user_agent:
-            headers.update({
-                "sec-ch-ua": self._get_sec_ch_ua(user_agent),
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": self._get_platform_from_ua(user_agent),
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none" if not referrer else "same-origin",
-                "Sec-Fetch-User": "?1",
-            })
+        headers.update(referred_extras if referrer else direct_extras)
         
         return headers
     
-    def _get_next_user_agent(self) -> str:
-        """Get next user agent in rotation to avoid patterns"""
+    def _get_next_user_agent(self, bits: int) -> Tuple[str, _HeaderPairs, _HeaderPairs]:
+        """Get next user agent profile in rotation to avoid patterns"""
         # Use round-robin with some randomization
-        if random.random() < 0.8:  # 80% of time use rotation
-            ua = self.USER_AGENTS[self._last_user_agent_index]
-            self._last_user_agent_index = (self._last_user_agent_index + 1) % len(self.USER_AGENTS)
-        else:  # 20% of time use random
-            ua = random.choice(self.USER_AGENTS)
-        
-        return ua
+        if bits >> 16 & 0xFF >= 51:  # 205/256, ~80% of time use rotation
+            return next(self._ua_cycle)
+        # ~20% of time use random
+        return self._UA_PROFILES[(bits >> 72 & 0xFFFF) % len(self._UA_PROFILES)]
     
     def _generate_realistic_referrer(self, url: str) -> str:
         """Generate a realistic referrer based on the target URL"""
-        parsed = urlparse(url)
-        domain = parsed.netloc
+        domain = _domain_of(url)
         
         # Common referrer patterns
         referrers = [
@@ -138,88 +207,152 @@ class RequestHeaderManager:
         ]
         
         return random.choice(referrers)
-    
-    def _get_sec_ch_ua(self, user_agent: str) -> str:
-        """Generate sec-ch-ua header based on user agent"""
-        if "Chrome/119" in user_agent:
-            return '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"'
-        elif "Chrome/118" in user_agent:
-            return '"Google Chrome";v="118", "Chromium";v="118", "Not=A?Brand";v="99"'
-        elif "Chrome/117" in user_agent:
-            return '"Google Chrome";v="117", "Chromium";v="117", "Not;A=Brand";v="8"'
-        else:
-            return '"Chromium";v="119", "Not?A_Brand";v="24"'
-    
-    def _get_platform_from_ua(self, user_agent: str) -> str:
-        """Extract platform for sec-ch-ua-platform header"""
-        if "Windows" in user_agent:
-            return '"Windows"'
-        elif "Macintosh" in user_agent:
-            return '"macOS"'
-        elif "Linux" in user_agent:
-            return '"Linux"'
-        else:
-            return '"Unknown"'
+
+
+@dataclass(slots=True)
+class _DomainState:
+    """Everything the rate limiter tracks for one domain, behind a single lookup"""
+    delay: float
+    tokens: float  # Token bucket fill
+    # time.monotonic_ns() of the last top-up, so clock adjustments can't skip or stretch a delay
+    refilled_at: Optional[int] = None
+    last_request: Optional[int] = None  # time.monotonic_ns(), shown as wall clock in stats
+    failures: int = 0  # Consecutive
 
 
 class RateLimiter:
     """Per-domain rate limiting to avoid triggering anti-bot measures"""
     
-    def __init__(self, default_delay: float = 2.0, max_delay: float = 30.0):
+    def __init__(self, default_delay: float = 2.0, max_delay: float = 30.0, burst: int = 1):
         self.default_delay = default_delay
         self.max_delay = max_delay
-        self.domain_delays: Dict[str, float] = {}
-        self.last_request_times: Dict[str, float] = {}
-        self.consecutive_failures: Dict[str, int] = {}
+        # Requests a domain may receive back to back after being idle; the
+        # average rate stays one per delay
+        self.burst = max(1, burst)
+        self._state: Dict[str, _DomainState] = {}
+        
+        # Per-domain queues of waiters, drained by at most one loop timer per domain
+        self._pending: Dict[str, Deque[asyncio.Future]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+    
+    def _domain_state(self, domain: str) -> _DomainState:
+        """Get or create the tracked state for a domain"""
+        state = self._state.get(domain)
+        if state is None:
+            state = self._state[domain] = _DomainState(self.default_delay, float(self.burst))
+        return state
         
     async def wait_for_domain(self, url: str) -> None:
         """Wait appropriate time before making request to domain"""
-        domain = urlparse(url).netloc
-        current_time = time.time()
-        
-        # Get delay for this domain
-        delay = self.domain_delays.get(domain, self.default_delay)
+        domain = _domain_of(url)
         
-        # Add randomization to avoid patterns
-        jittered_delay = delay * (0.8 + random.random() * 0.4)  # ±20% jitter
+        # Queue behind earlier callers for the domain; they are released in order
+        ticket = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(domain, deque()).append(ticket)
+        if domain not in self._timers:
+            self._release(domain)
         
-        # Check if we need to wait
-        last_request = self.last_request_times.get(domain, 0)
-        time_since_last = current_time - last_request
-        
-        if time_since_last < jittered_delay:
-            wait_time = jittered_delay - time_since_last
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-            await asyncio.sleep(wait_time)
+        await ticket
+    
+    def _release(self, domain: str, token_due: bool = False) -> None:
+        """Release a domain's queued waiters in order as its token bucket allows.
+        
+        Runs inline for a waiter that finds no timer pending, otherwise from the
+        domain's single loop timer, which is rescheduled for the next token.
+        """
+        self._timers.pop(domain, None)
+        pending = self._pending.get(domain)
+        state = self._domain_state(domain)
+        
+        while pending:
+            # Drop waiters that were cancelled while queued
+            if pending[0].done():
+                pending.popleft()
+                continue
+            
+            now = time.monotonic_ns()
+            if token_due:
+                # The timer fired when the next token was due
+                tokens = 1.0
+                token_due = False
+            else:
+                # Add randomization to avoid patterns
+                jittered_delay = state.delay * (0.8 + random.random() * 0.4)  # ±20% jitter
+                
+                # Refill one token per delay, capped at the burst size
+                elapsed_ns = now - state.refilled_at if state.refilled_at is not None else 0
+                tokens = min(self.burst, state.tokens + elapsed_ns / (jittered_delay * 1e9))
+                
+                # Check if we need to wait
+                if tokens < 1:
+                    wait_time = (1 - tokens) * jittered_delay
+                    logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+                    state.tokens = tokens
+                    state.refilled_at = now
+                    self._timers[domain] = asyncio.get_running_loop().call_later(
+                        wait_time, self._release, domain, True
+                    )
+                    return
+            
+            # Update last request time
+            state.tokens = tokens - 1
+            state.refilled_at = now
+            state.last_request = now
+            pending.popleft().set_result(None)
         
-        # Update last request time
-        self.last_request_times[domain] = time.time()
+        self._pending.pop(domain, None)
+    
+    async def run_batch(
+        self,
+        urls: List[str],
+        worker: Callable[[str], Awaitable[Any]]
+    ) -> List[Any]:
+        """Run worker over urls with one sequential lane per domain, domains in parallel.
+        
+        Results (or the exception a URL raised) are returned in input order.
+        """
+        lanes: Dict[str, Deque[int]] = defaultdict(deque)
+        for index, url in enumerate(urls):
+            lanes[_domain_of(url)].append(index)
+        
+        results: List[Any] = [None] * len(urls)
+        
+        async def run_lane(indexes: Deque[int]) -> None:
+            while indexes:
+                index = indexes.popleft()
+                await self.wait_for_domain(urls[index])
+                try:
+                    results[index] = await worker(urls[index])
+                except Exception as e:
+                    results[index] = e
+        
+        await asyncio.gather(*(run_lane(indexes) for indexes in lanes.values()))
+        return results
     
     def record_success(self, url: str) -> None:
         """Record successful request to potentially reduce delay"""
-        domain = urlparse(url).netloc
+        domain = _domain_of(url)
+        state = self._domain_state(domain)
         
         # Reset failure count
-        self.consecutive_failures[domain] = 0
+        state.failures = 0
         
         # Gradually reduce delay for successful domains
-        current_delay = self.domain_delays.get(domain, self.default_delay)
-        if current_delay > self.default_delay:
-            new_delay = max(self.default_delay, current_delay * 0.8)
-            self.domain_delays[domain] = new_delay
+        if state.delay > self.default_delay:
+            new_delay = max(self.default_delay, state.delay * 0.8)
+            state.delay = new_delay
             logger.debug(f"Reduced delay for {domain} to {new_delay:.2f}s")
     
     def record_failure(self, url: str, is_rate_limited: bool = False) -> None:
         """Record failed request to increase delay"""
-        domain = urlparse(url).netloc
+        domain = _domain_of(url)
+        state = self._domain_state(domain)
         
         # Increment failure count
-        failures = self.consecutive_failures.get(domain, 0) + 1
-        self.consecutive_failures[domain] = failures
+        state.failures += 1
+        failures = state.failures
         
         # Increase delay based on failure type and count
-        current_delay = self.domain_delays.get(domain, self.default_delay)
-        
         if is_rate_limited:
             # Significant increase for rate limiting
             multiplier = 2.0 + (failures * 0.5)
@@ -227,21 +360,44 @@ class RateLimiter:
             # Moderate increase for other failures
             multiplier = 1.2 + (failures * 0.1)
         
-        new_delay = min(self.max_delay, current_delay * multiplier)
-        self.domain_delays[domain] = new_delay
+        new_delay = min(self.max_delay, state.delay * multiplier)
+        state.delay = new_delay
         
         logger.warning(f"Increased delay for {domain} to {new_delay:.2f}s after {failures} failures")
     
     def get_domain_stats(self) -> Dict[str, Dict]:
         """Get statistics for all domains"""
-        stats = {}
-        for domain in set(list(self.domain_delays.keys()) + list(self.last_request_times.keys())):
-            stats[domain] = {
-                "delay": self.domain_delays.get(domain, self.default_delay),
-                "failures": self.consecutive_failures.get(domain, 0),
-                "last_request": self.last_request_times.get(domain, 0),
+        # Request times are kept on the monotonic clock; convert them once here
+        wall_offset = time.time() - time.monotonic_ns() / 1e9
+        return {
+            domain: {
+                "delay": state.delay,
+                "failures": state.failures,
+                "last_request": (
+                    wall_offset + state.last_request / 1e9 if state.last_request is not None else 0.0
+                ),
             }
-        return stats
+            for domain, state in self._state.items()
+        }
+
+
+# Substrings of a lowercased error message, each list scanned in one regex pass
+_NON_RETRYABLE_RE = re.compile('|'.join(map(re.escape, [
+    "404",
+    "not found",
+    "invalid url",
+    "malformed",
+    "unauthorized access",  # Our custom error for auth walls
+])))
+
+_RETRYABLE_RE = re.compile('|'.join(map(re.escape, [
+    "500", "502", "503", "504",
+    "timeout",
+    "connection",
+    "rate limit",
+    "forbidden",  # 403 might be temporary
+    "too many requests",
+])))
 
 
 class RetryManager:
@@ -251,6 +407,10 @@ class RetryManager:
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
+        # Exponential backoff before retry 1..max_retries, capped at max_delay
+        self._backoff_delays = tuple(
+            min(max_delay, base_delay * (1 << i)) for i in range(max_retries)
+        )
     
     async def execute_with_retry(self, func, *args, **kwargs):
         """Execute function with retry logic and exponential backoff"""
@@ -259,8 +419,8 @@ class RetryManager:
         for attempt in range(self.max_retries + 1):
             try:
                 if attempt > 0:
-                    # Calculate delay with exponential backoff and jitter
-                    delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+                    # Precomputed exponential backoff with jitter
+                    delay = self._backoff_delays[attempt - 1]
                     jittered_delay = delay * (0.5 + random.random() * 0.5)  # 50-100% of delay
                     
                     logger.info(f"Retry attempt {attempt}/{self.max_retries} in {jittered_delay:.2f}s")
@@ -290,28 +450,11 @@ class RetryManager:
         error_str = str(error).lower()
         
         # Don't retry on client errors that won't change
-        non_retryable_patterns = [
-            "404",
-            "not found", 
-            "invalid url",
-            "malformed",
-            "unauthorized access",  # Our custom error for auth walls
-        ]
-        
-        if any(pattern in error_str for pattern in non_retryable_patterns):
+        if _NON_RETRYABLE_RE.search(error_str):
             return False
         
         # Retry on server errors, timeouts, connection issues
-        retryable_patterns = [
-            "500", "502", "503", "504",
-            "timeout",
-            "connection",
-            "rate limit",
-            "forbidden",  # 403 might be temporary
-            "too many requests",
-        ]
-        
-        return any(pattern in error_str for pattern in retryable_patterns)
+        return _RETRYABLE_RE.search(error_str) is not None
 
 
 class ProxyManager:
@@ -319,19 +462,27 @@ class ProxyManager:
     
     def __init__(self, proxies: List[str] = None):
         self.proxies = proxies or []
-        self.current_proxy_index = 0
-        self.proxy_failures: Dict[str, int] = {}
+        self._proxy_set = set(self.proxies)  # O(1) membership alongside the ordered list
+        self._cycle = itertools.cycle(self.proxies)  # Rebuilt whenever the pool changes
+        self.proxy_failures: Dict[str, int] = defaultdict(int)
+        self._failed: set = set()  # Proxies at or over max_failures, skipped in rotation
         self.max_failures = 3
         
     def add_proxy(self, proxy_url: str) -> None:
         """Add a proxy to the rotation list"""
-        if proxy_url not in self.proxies:
+        if proxy_url not in self._proxy_set:
+            self._proxy_set.add(proxy_url)
             self.proxies.append(proxy_url)
+            self._cycle = itertools.cycle(self.proxies)
             
     def remove_proxy(self, proxy_url: str) -> None:
         """Remove a proxy from the rotation list"""
-        if proxy_url in self.proxies:
+        if proxy_url in self._proxy_set:
+            self._proxy_set.discard(proxy_url)
             self.proxies.remove(proxy_url)
+            self._cycle = itertools.cycle(self.proxies)
+            
+            self._failed.discard(proxy_url)
             if proxy_url in self.proxy_failures:
                 del self.proxy_failures[proxy_url]
     
@@ -341,21 +492,15 @@ class ProxyManager:
             return None
         
         # Find a working proxy (not failed too many times)
-        attempts = 0
-        while attempts < len(self.proxies):
-            proxy = self.proxies[self.current_proxy_index]
-            self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxies)
-            
-            # Check if this proxy has failed too many times
-            failures = self.proxy_failures.get(proxy, 0)
-            if failures < self.max_failures:
+        for _ in range(len(self.proxies)):
+            proxy = next(self._cycle)
+            if proxy not in self._failed:
                 return proxy
-            
-            attempts += 1
         
         # All proxies have failed, reset failure counts and try again
         logger.warning("All proxies have failed, resetting failure counts")
         self.proxy_failures.clear()
+        self._failed.clear()
         return self.proxies[0] if self.proxies else None
     
     def record_proxy_success(self, proxy_url: str) -> None:
@@ -363,10 +508,14 @@ class ProxyManager:
         if proxy_url in self.proxy_failures:
             # Reduce failure count on success
             self.proxy_failures[proxy_url] = max(0, self.proxy_failures[proxy_url] - 1)
+            if self.proxy_failures[proxy_url] < self.max_failures:
+                self._failed.discard(proxy_url)
     
     def record_proxy_failure(self, proxy_url: str) -> None:
         """Record proxy failure"""
-        self.proxy_failures[proxy_url] = self.proxy_failures.get(proxy_url, 0) + 1
+        self.proxy_failures[proxy_url] += 1
+        if self.proxy_failures[proxy_url] >= self.max_failures:
+            self._failed.add(proxy_url)
         logger.warning(f"Proxy {proxy_url} failed {self.proxy_failures[proxy_url]} times")
     
     def get_proxy_stats(self) -> Dict[str, Dict]:
@@ -385,17 +534,23 @@ class SessionManager:
     
     def __init__(self):
         self.domain_sessions: Dict[str, Dict] = {}
+        # (monotonic creation ns, domain) min-heap, so cleanup only visits expired sessions
+        self._creation_heap: List[Tuple[int, str]] = []
     
     def get_session_data(self, url: str) -> Dict:
         """Get or create session data for domain"""
-        domain = urlparse(url).netloc
+        domain = _domain_of(url)
         
         if domain not in self.domain_sessions:
+            created_ns = time.monotonic_ns()  # For age checks immune to clock jumps
             self.domain_sessions[domain] = {
                 "cookies": {},
+                "_cookie_header": None,  # Serialized cookies, rebuilt only when they change
                 "created_at": time.time(),
+                "_created_ns": created_ns,
                 "request_count": 0,
             }
+            heapq.heappush(self._creation_heap, (created_ns, domain))
         
         return self.domain_sessions[domain]
     
@@ -407,7 +562,12 @@ class SessionManager:
         
         # Update cookies if provided
         if response_cookies:
-            session_data["cookies"].update(response_cookies)
+            cookies = session_data["cookies"]
+            if any(cookies.get(name) != value for name, value in response_cookies.items()):
+                cookies.update(response_cookies)
+                session_data["_cookie_header"] = "; ".join(
+                    f"{name}={value}" for name, value in cookies.items()
+                )
     
     def get_session_headers(self, url: str) -> Dict[str, str]:
         """Get session-specific headers including cookies"""
@@ -415,22 +575,19 @@ class SessionManager:
         headers = {}
         
         # Add cookies if we have them
-        if session_data["cookies"]:
-            cookie_string = "; ".join([f"{k}={v}" for k, v in session_data["cookies"].items()])
-            headers["Cookie"] = cookie_string
+        if session_data["_cookie_header"]:
+            headers["Cookie"] = session_data["_cookie_header"]
         
         return headers
     
     def cleanup_old_sessions(self, max_age_hours: int = 24) -> None:
         """Remove old session data to prevent memory leaks"""
-        current_time = time.time()
-        max_age_seconds = max_age_hours * 3600
-        
-        domains_to_remove = []
-        for domain, session_data in self.domain_sessions.items():
-            if current_time - session_data["created_at"] > max_age_seconds:
-                domains_to_remove.append(domain)
-        
-        for domain in domains_to_remove:
-            del self.domain_sessions[domain]
-            logger.debug(f"Cleaned up old session for {domain}")
\ No newline at end of file
+        cutoff_ns = time.monotonic_ns() - max_age_hours * 3600 * 1_000_000_000
+        
+        # Oldest sessions sit at the top of the heap; stop at the first one young enough
+        while self._creation_heap and self._creation_heap[0][0] < cutoff_ns:
+            created_ns, domain = heapq.heappop(self._creation_heap)
+            session_data = self.domain_sessions.get(domain)
+            if session_data is not None and session_data["_created_ns"] == created_ns:
+                del self.domain_sessions[domain]
+                logger.debug(f"Cleaned up old session for {domain}")
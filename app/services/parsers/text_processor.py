@@ -1,8 +1,65 @@
 import re
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, FrozenSet, Set, Tuple, Optional
 from dataclasses import dataclass
 
 
+# Compiled once at import and shared by every processor
+_CRLF_RE = re.compile(r'\r\n')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_URL_RE = re.compile(r'http[s]?://\S+')
+_BULLET_RE = re.compile(r'^\s*[-•*]\s+')
+_NUMBER_RE = re.compile(r'\d+')
+# Alphabetic runs, so '250g' still yields the unit 'g'
+_WORD_RE = re.compile(r'[^\W\d_]+')
+
+
+def _inflection_stems(word: str) -> Tuple[str, ...]:
+    """Candidate base forms of a plural or inflected word: peppers, tbsps, fried, chopped, whisking"""
+    stems = []
+    if word.endswith(('ies', 'ied')):
+        stems.append(word[:-3] + 'y')  # fries, fried -> fry
+    for suffix in ('ed', 'ing'):
+        if word.endswith(suffix):
+            base = word[:-len(suffix)]
+            if len(base) >= 2:
+                # baked -> bake, chopped -> chop, whisking -> whisk, slicing -> slice
+                stems.extend((base, base + 'e'))
+                if len(base) >= 3 and base[-1] == base[-2]:
+                    stems.append(base[:-1])
+    if word.endswith('s') and len(word) > 2:
+        stems.append(word[:-1])  # lbs -> lb, peppers -> pepper
+        if word.endswith('es'):
+            stems.append(word[:-2])  # tomatoes -> tomato, pinches -> pinch
+    return tuple(stems)
+_STEP_NUMBER_RE = re.compile(r'^\d+\.\s*')
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@(\w+)')
+_SERVINGS_LINE_RE = re.compile(r'makes?\s+\d+.*servings?|serves?\s+\d+')
+_TIME_TEMP_RE = re.compile(r'until|for \d+|°|degrees|minutes?|hours?|oven|bake')
+_INSTRUCTION_TIME_RE = re.compile(r'until|for \d+|degrees?|minutes?|hours?|°[cf]')
+
+_INSTRUCTION_PATTERNS = tuple(re.compile(p) for p in [
+    r'^\d+\.',  # Numbered steps
+    r'^step \d+',  # Step numbered
+    r'^\d+\)\s+',  # 1) format
+    r'^first|^then|^next|^finally',  # Sequence words
+])
+
+# Tried in order, first match wins
+_SERVINGS_PATTERNS = tuple(re.compile(p) for p in [
+    r'makes?\s+(\d+(?:\s*to\s*\d+)?)\s*servings?',
+    r'serves?\s+(\d+(?:\s*to\s*\d+)?)',
+    r'(\d+(?:\s*-\s*\d+)?)\s*servings?',
+    r'yield:?\s*(\d+(?:\s*to\s*\d+)?)',
+])
+
+# Recipe-related words whose presence raises confidence
+_RECIPE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, [
+    'recipe', 'cook', 'bake', 'ingredients', 'instructions',
+    'delicious', 'homemade', 'easy', 'simple', 'tasty'
+])))
+
+
 @dataclass
 class RecipePattern:
     """Pattern matching result for recipe components"""
@@ -19,7 +76,7 @@ class TextProcessor:
     def __init__(self):
         # Common recipe keywords and patterns
         self.ingredient_keywords = [
-            'ingredients?', 'recipe', 'you[\'ll]? need', 'shopping list',
+            'ingredients?', 'recipe', 'you\'?ll need', 'shopping list',
             'what you need', 'grocery list', 'supplies'
         ]
         
@@ -28,23 +85,82 @@ class TextProcessor:
             'preparation', 'cooking method', 'recipe', 'procedure'
         ]
         
+        # Section header keywords are regex fragments, each list matched in one pass.
+        # Only a header-shaped line counts: the keyword plus an optional short "for ..."
+        # phrase or parenthetical ("Ingredients for the cake:", "INGREDIENTS (serves 4)"),
+        # so steps like "Step 1: Whisk the flour" stay in their section.
+        self._ingredient_header_re = self._header_pattern(self.ingredient_keywords)
+        self._instruction_header_re = self._header_pattern(self.instruction_keywords)
+        
         # Common measurement units
-        self.measurement_units = [
+        self.measurement_units = frozenset([
             'cup', 'cups', 'tbsp', 'tablespoon', 'tablespoons', 'tsp', 'teaspoon', 'teaspoons',
             'oz', 'ounce', 'ounces', 'lb', 'pound', 'pounds', 'g', 'gram', 'grams',
             'kg', 'kilogram', 'kilograms', 'ml', 'milliliter', 'milliliters',
             'l', 'liter', 'liters', 'pinch', 'dash', 'handful', 'clove', 'cloves',
             'slice', 'slices', 'piece', 'pieces', 'can', 'cans', 'jar', 'jars',
             'package', 'packages', 'bunch', 'bunches'
-        ]
+        ])
         
         # Common cooking actions for instructions
-        self.cooking_actions = [
+        self.cooking_actions = frozenset([
             'mix', 'stir', 'combine', 'whisk', 'beat', 'fold', 'chop', 'dice',
             'mince', 'slice', 'cut', 'heat', 'cook', 'bake', 'fry', 'sauté',
             'boil', 'simmer', 'roast', 'grill', 'season', 'add', 'remove',
             'serve', 'garnish', 'blend', 'process', 'knead', 'roll', 'pour'
-        ]
+        ])
+        
+        # Food words that make a short line with a number look like an ingredient
+        self.food_indicators = frozenset([
+            'oil', 'salt', 'pepper', 'sugar', 'flour', 'butter', 'milk',
+            'egg', 'cheese', 'chicken', 'beef', 'fish', 'onion', 'garlic',
+            'tomato', 'water', 'vinegar', 'lemon', 'herbs', 'spice', 'vanilla',
+            'baking', 'powder', 'soda', 'chocolate', 'chips'
+        ])
+        
+        # Single words or short phrases that are common recipe section headers
+        self.category_indicators = frozenset([
+            'dressing', 'sauce', 'marinade', 'filling', 'topping', 'garnish',
+            'salad', 'chicken', 'beef', 'fish', 'vegetables', 'base', 'mix',
+            'serving', 'assembly', 'crust', 'batter'
+        ])
+        
+        # Instruction section headers, never ingredient categories
+        self.instruction_headers = frozenset(['instructions', 'directions', 'method', 'steps', 'preparation'])
+        
+        # Verbs that keep a line ending in ':' from being a category header
+        self.header_verbs = frozenset(['make', 'add', 'mix', 'cook', 'heat'])
+        
+        # Strong instruction indicators, checked with one startswith call
+        self.instruction_starters = (
+            'make the', 'in a', 'add the', 'combine', 'mix', 'stir', 'blend',
+            'season with', 'pour', 'toss', 'cook', 'heat', 'bake', 'fry'
+        )
+        
+        # Every vocabulary word mapped to the labels of the lists containing it,
+        # so one pass over a line's words classifies it against all of them
+        word_labels: Dict[str, Set[str]] = {}
+        for label, words in (
+            ('unit', self.measurement_units),
+            ('action', self.cooking_actions),
+            ('food', self.food_indicators),
+            ('category', self.category_indicators),
+            ('section', self.instruction_headers),
+            ('verb', self.header_verbs),
+        ):
+            for word in words:
+                word_labels.setdefault(word, set()).add(label)
+        self._word_labels = {word: frozenset(labels) for word, labels in word_labels.items()}
+    
+    @staticmethod
+    def _header_pattern(keywords: List[str]) -> re.Pattern:
+        """Compile keyword fragments into a regex matching header-shaped lines only"""
+        return re.compile(
+            r'^\W*\b(?:' + '|'.join(keywords) + r')\b'
+            r'(?:\s+for\s+[^\W\d][\w\s\'&-]{0,40})?'  # for the cake
+            r'(?:\s*\([^)]{0,40}\))?'  # (serves 4)
+            r'\W*$'
+        )
     
     def extract_recipe_from_text(self, text: str) -> RecipePattern:
         """Main method to extract recipe components from text"""
@@ -78,11 +194,11 @@ class TextProcessor:
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for processing"""
         # Preserve line breaks for better section detection
-        text = re.sub(r'\r\n', '\n', text)  # Normalize Windows line breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Limit excessive line breaks
+        text = _CRLF_RE.sub('\n', text)  # Normalize Windows line breaks
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)  # Limit excessive line breaks
         
         # Remove common social media artifacts but keep structure
-        text = re.sub(r'http[s]?://\S+', '', text)  # Remove URLs
+        text = _URL_RE.sub('', text)  # Remove URLs
         
         return text.strip()
     
@@ -123,12 +239,12 @@ class TextProcessor:
             line_lower = line.lower()
             
             # Check if line indicates start of ingredients section
-            if any(keyword in line_lower for keyword in self.ingredient_keywords):
+            if self._ingredient_header_re.match(line_lower):
                 current_section = 'ingredients'
                 continue
             
             # Check if line indicates start of instructions section
-            if any(keyword in line_lower for keyword in self.instruction_keywords):
+            if self._instruction_header_re.match(line_lower):
                 current_section = 'instructions'
                 continue
             
@@ -175,35 +291,47 @@ class TextProcessor:
         
         return instructions[:15]  # Limit to reasonable number
     
-    def _looks_like_ingredient(self, line: str) -> bool:
+    def _classify(self, line: str) -> FrozenSet[str]:
+        """Labels of every vocabulary with a word in the line, from one pass over its words"""
+        word_labels = self._word_labels
+        labels: Set[str] = set()
+        for word in _WORD_RE.findall(line.lower()):
+            hit = word_labels.get(word)
+            if hit is None:
+                # Plurals and inflected verbs fall back to their base form
+                for stem in _inflection_stems(word):
+                    hit = word_labels.get(stem)
+                    if hit is not None:
+                        break
+            if hit:
+                labels |= hit
+        return frozenset(labels)
+    
+    def _looks_like_ingredient(self, line: str, labels: Optional[FrozenSet[str]] = None) -> bool:
         """Determine if a line looks like an ingredient"""
         line_lower = line.lower().strip()
+        if labels is None:
+            labels = self._classify(line)
         
         # Skip empty lines or very short lines
         if len(line_lower) < 3:
             return False
         
         # Check for bullet points or list indicators first
-        if re.match(r'^\s*[-•*]\s+', line):
+        if _BULLET_RE.match(line):
             # Remove bullet point for further analysis
-            line_clean = re.sub(r'^\s*[-•*]\s+', '', line_lower)
+            line_clean = _BULLET_RE.sub('', line_lower)
             if len(line_clean.split()) <= 8 and len(line_clean) > 3:
                 return True
         
         # Check for measurement units
-        if any(unit in line_lower for unit in self.measurement_units):
+        if 'unit' in labels:
             return True
         
         # Check for numbers (quantities) with reasonable length
-        if re.search(r'\d+', line) and len(line.split()) <= 8:
+        if _NUMBER_RE.search(line) and len(line.split()) <= 8:
             # Must have some food-related words or be reasonably short
-            food_indicators = [
-                'oil', 'salt', 'pepper', 'sugar', 'flour', 'butter', 'milk',
-                'egg', 'cheese', 'chicken', 'beef', 'fish', 'onion', 'garlic',
-                'tomato', 'water', 'vinegar', 'lemon', 'herbs', 'spice', 'vanilla',
-                'baking', 'powder', 'soda', 'chocolate', 'chips'
-            ]
-            if any(food in line_lower for food in food_indicators):
+            if 'food' in labels:
                 return True
         
         return False
@@ -217,24 +345,17 @@ class TextProcessor:
             return False
         
         # Check for instruction patterns first
-        instruction_patterns = [
-            r'^\d+\.',  # Numbered steps
-            r'^step \d+',  # Step numbered
-            r'^\d+\)\s+',  # 1) format
-            r'^first|^then|^next|^finally',  # Sequence words
-        ]
-        
-        if any(re.search(pattern, line_lower) for pattern in instruction_patterns):
+        if any(pattern.search(line_lower) for pattern in _INSTRUCTION_PATTERNS):
             return True
         
         # Check for cooking action words
-        if any(action in line_lower for action in self.cooking_actions):
+        if 'action' in self._classify(line):
             # Must be reasonably long to be an instruction
             if len(line.split()) >= 3:
                 return True
         
         # Check for time/temperature indicators
-        if re.search(r'until|for \d+|°|degrees|minutes?|hours?|oven|bake', line_lower):
+        if _TIME_TEMP_RE.search(line_lower):
             if len(line.split()) >= 3:
                 return True
         
@@ -257,12 +378,7 @@ class TextProcessor:
             score += 0.2
         
         # Check for recipe-related keywords in full text
-        recipe_keywords = [
-            'recipe', 'cook', 'bake', 'ingredients', 'instructions',
-            'delicious', 'homemade', 'easy', 'simple', 'tasty'
-        ]
-        
-        keyword_count = sum(1 for keyword in recipe_keywords if keyword in full_text.lower())
+        keyword_count = len(set(_RECIPE_KEYWORDS_RE.findall(full_text.lower())))
         score += min(keyword_count * 0.05, 0.2)
         
         # Penalty for very short content
@@ -273,12 +389,12 @@ class TextProcessor:
     
     def extract_hashtags(self, text: str) -> List[str]:
         """Extract hashtags from text"""
-        hashtags = re.findall(r'#(\w+)', text)
+        hashtags = _HASHTAG_RE.findall(text)
         return hashtags
     
     def extract_mentions(self, text: str) -> List[str]:
         """Extract mentions from text"""
-        mentions = re.findall(r'@(\w+)', text)
+        mentions = _MENTION_RE.findall(text)
         return mentions
     
     def detect_recipe_type(self, text: str) -> Optional[str]:
@@ -302,16 +418,9 @@ class TextProcessor:
     
     def _extract_servings_info(self, text: str) -> Optional[str]:
         """Extract serving information from text"""
-        servings_patterns = [
-            r'makes?\s+(\d+(?:\s*to\s*\d+)?)\s*servings?',
-            r'serves?\s+(\d+(?:\s*to\s*\d+)?)',
-            r'(\d+(?:\s*-\s*\d+)?)\s*servings?',
-            r'yield:?\s*(\d+(?:\s*to\s*\d+)?)',
-        ]
-        
         text_lower = text.lower()
-        for pattern in servings_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _SERVINGS_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 return match.group(1)
         return None
@@ -329,7 +438,7 @@ class TextProcessor:
                 continue
                 
             # Skip servings info
-            if re.search(r'makes?\s+\d+.*servings?|serves?\s+\d+', line.lower()):
+            if _SERVINGS_LINE_RE.search(line.lower()):
                 continue
                 
             # Skip obvious instructions (long sentences with cooking verbs)
@@ -362,7 +471,7 @@ class TextProcessor:
                 
             # Skip category headers and serving info
             if (self._looks_like_category_header(line) or 
-                re.search(r'makes?\s+\d+.*servings?|serves?\s+\d+', line.lower())):
+                _SERVINGS_LINE_RE.search(line.lower())):
                 continue
                 
             # Check if it looks like an instruction
@@ -371,42 +480,35 @@ class TextProcessor:
         
         return instructions[:15]
     
-    def _looks_like_category_header(self, line: str) -> bool:
+    def _looks_like_category_header(self, line: str, labels: Optional[FrozenSet[str]] = None) -> bool:
         """Check if line looks like a category header (e.g., 'Dressing', 'Chicken Salad')"""
         line = line.strip()
+        if labels is None:
+            labels = self._classify(line)
         
         # Don't treat instruction section headers as ingredient categories
-        instruction_headers = ['instructions', 'directions', 'method', 'steps', 'preparation']
-        if any(header in line.lower() for header in instruction_headers):
+        if 'section' in labels:
             return False
         
-        # Single words or short phrases that are common recipe section headers
-        category_indicators = [
-            'dressing', 'sauce', 'marinade', 'filling', 'topping', 'garnish',
-            'salad', 'chicken', 'beef', 'fish', 'vegetables', 'base', 'mix',
-            'for serving', 'assembly', 'crust', 'batter'
-        ]
-        
         # Must be relatively short and not contain measurements
         if (len(line.split()) <= 3 and 
-            not re.search(r'\d+', line) and 
-            not any(unit in line.lower() for unit in self.measurement_units) and
+            not _NUMBER_RE.search(line) and 
+            'unit' not in labels and
             len(line) > 3):
             
             # Check if it matches common category patterns
-            line_lower = line.lower()
-            if any(cat in line_lower for cat in category_indicators):
+            if 'category' in labels:
                 return True
                 
             # Or if it's a simple noun phrase without articles and colons (like "Chicken Salad:")
-            if (not line_lower.startswith(('a ', 'an ', 'the ')) and
-                not any(verb in line_lower for verb in ['make', 'add', 'mix', 'cook', 'heat']) and
+            if (not line.lower().startswith(('a ', 'an ', 'the ')) and
+                'verb' not in labels and
                 line.endswith(':')):
                 return True
         
         return False
     
-    def _looks_like_instruction_not_ingredient(self, line: str) -> bool:
+    def _looks_like_instruction_not_ingredient(self, line: str, labels: Optional[FrozenSet[str]] = None) -> bool:
         """Check if line looks like an instruction rather than an ingredient"""
         line_lower = line.lower().strip()
         
@@ -415,21 +517,19 @@ class TextProcessor:
             return False
         
         # Strong instruction indicators
-        instruction_starters = [
-            'make the', 'in a', 'add the', 'combine', 'mix', 'stir', 'blend',
-            'season with', 'pour', 'toss', 'cook', 'heat', 'bake', 'fry'
-        ]
-        
-        if any(line_lower.startswith(starter) for starter in instruction_starters):
+        if line_lower.startswith(self.instruction_starters):
             return True
         
+        if labels is None:
+            labels = self._classify(line)
+        
         # Check for cooking actions in longer sentences
         if (len(line.split()) >= 5 and 
-            any(action in line_lower for action in self.cooking_actions)):
+            'action' in labels):
             return True
         
         # Check for instruction patterns
-        if re.search(r'until|for \d+|degrees?|minutes?|hours?|°[cf]', line_lower):
+        if _INSTRUCTION_TIME_RE.search(line_lower):
             return True
         
         return False
@@ -456,17 +556,20 @@ class TextProcessor:
                 continue
                 
             # Skip serving info
-            if re.search(r'makes?\s+\d+.*servings?|serves?\s+\d+', line.lower()):
+            if _SERVINGS_LINE_RE.search(line.lower()):
                 continue
+            
+            # Classify once for all the checks below
+            labels = self._classify(line)
                 
             # Skip obvious instructions
-            if self._looks_like_instruction_not_ingredient(line):
+            if self._looks_like_instruction_not_ingredient(line, labels):
                 continue
                 
             # Check if it's a category header
-            if self._looks_like_category_header(line) and not self._looks_like_instruction_not_ingredient(line):
-                # Save previous category if it has items
-                if current_category and current_items:
+            if self._looks_like_category_header(line, labels) and not self._looks_like_instruction_not_ingredient(line, labels):
+                # Save previous category if it has items, keeping any uncategorized lead-in
+                if current_items:
                     categorized_ingredients.append((current_category, current_items))
                 
                 # Start new category
@@ -475,7 +578,7 @@ class TextProcessor:
                 continue
                 
             # Check if it looks like an ingredient
-            if self._looks_like_ingredient(line):
+            if self._looks_like_ingredient(line, labels):
                 current_items.append(line)
         
         # Add final category
@@ -499,14 +602,16 @@ class TextProcessor:
             line = line.strip()
             if not line:
                 continue
+            
+            labels = self._classify(line)
                 
             # Skip category headers and serving info
-            if (self._looks_like_category_header(line) or 
-                re.search(r'makes?\s+\d+.*servings?|serves?\s+\d+', line.lower())):
+            if (self._looks_like_category_header(line, labels) or 
+                _SERVINGS_LINE_RE.search(line.lower())):
                 continue
                 
             # Check if it looks like an instruction
-            if self._looks_like_instruction_not_ingredient(line):
+            if self._looks_like_instruction_not_ingredient(line, labels):
                 instructions.append(line)
         
         # Convert to HTML ordered list
@@ -521,7 +626,7 @@ class TextProcessor:
             line = line.strip()
             # Skip title-like lines and serving info
             if (len(line) > 50 and 
-                not re.search(r'makes?\s+\d+.*servings?|serves?\s+\d+', line.lower()) and
+                not _SERVINGS_LINE_RE.search(line.lower()) and
                 not self._looks_like_ingredient(line) and
                 not self._looks_like_instruction_not_ingredient(line)):
                 return line
@@ -556,7 +661,7 @@ class TextProcessor:
         cleaned_instructions = []
         for instruction in instructions:
             # Remove existing numbering (1., 2., etc.)
-            cleaned = re.sub(r'^\d+\.\s*', '', instruction.strip())
+            cleaned = _STEP_NUMBER_RE.sub('', instruction.strip())
             if cleaned:
                 cleaned_instructions.append(cleaned)
         
@@ -588,11 +693,7 @@ class TextProcessor:
             score += 0.2
         
         # Check for recipe-related keywords
-        recipe_keywords = [
-            'recipe', 'cook', 'bake', 'ingredients', 'instructions',
-            'delicious', 'homemade', 'easy', 'simple', 'tasty'
-        ]
-        keyword_count = sum(1 for keyword in recipe_keywords if keyword in full_text.lower())
+        keyword_count = len(set(_RECIPE_KEYWORDS_RE.findall(full_text.lower())))
         score += min(keyword_count * 0.05, 0.15)
         
         return min(score, 1.0)
\ No newline at end of file
@@ -3,9 +3,10 @@ import re
 import asyncio
 import logging
 from typing import Dict, Any, List, Tuple, Optional
+from app.core.config import settings
 from .base_parser import BaseParser, ParsedRecipe
 from .request_utils import RequestHeaderManager, RateLimiter, RetryManager, SessionManager, ProxyManager
-from .browser_automation import BrowserAutomation, PLAYWRIGHT_AVAILABLE
+from .browser_automation import BrowserAutomation, PLAYWRIGHT_AVAILABLE, get_domain_strategy, set_domain_strategy
 from .progress_events import ProgressEventEmitter, ProgressPhase, ProgressStatus
 
 
@@ -49,7 +50,7 @@ class URLParser(BaseParser):
     def __init__(self, proxies: List[str] = None):
         super().__init__()
         self.header_manager = RequestHeaderManager()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(burst=settings.RATE_LIMIT_BURST)
         self.retry_manager = RetryManager()
         self.session_manager = SessionManager()
         self.proxy_manager = ProxyManager(proxies)
@@ -100,6 +101,40 @@ class URLParser(BaseParser):
         self.metrics["total_requests"] += 1
         self.metrics["domains_parsed"].add(domain)
         
+        # Domains that recently needed a browser skip the HTTP attempts
+        if self.use_browser_fallback and get_domain_strategy(domain) == "browser":
+            if progress_emitter:
+                progress_emitter.emit_event(
+                    ProgressPhase.TRYING_BROWSER,
+                    ProgressStatus.IN_PROGRESS,
+                    "Domain recently required browser automation, trying it first",
+                    method="browser-automation",
+                    metadata={"domain": domain, "strategy": "remembered"}
+                )
+            
+            try:
+                result = await self.retry_manager.execute_with_retry(
+                    self._parse_with_browser_automation, url, progress_emitter
+                )
+                self.rate_limiter.record_success(url)
+                self.metrics["successful_requests"] += 1
+                self.metrics["browser_automation_used"] += 1
+                set_domain_strategy(domain, "browser")
+                
+                if progress_emitter:
+                    progress_emitter.emit_event(
+                        ProgressPhase.COMPLETED,
+                        ProgressStatus.SUCCESS,
+                        f"Successfully parsed recipe via browser automation: {result.title}",
+                        method="browser-automation",
+                        metadata={"title": result.title, "confidence": result.confidence_score}
+                    )
+                
+                return result
+            except Exception as e:
+                # Fall back to the full chain; the domain may no longer need a browser
+                logger.warning(f"Remembered browser strategy failed for {url}: {e}")
+        
         # Try recipe-scrapers first (supports 500+ sites)
         if RECIPE_SCRAPERS_AVAILABLE:
             if progress_emitter:
@@ -118,6 +153,7 @@ class URLParser(BaseParser):
                 self.rate_limiter.record_success(url)
                 self.metrics["successful_requests"] += 1
                 self.metrics["recipe_scrapers_used"] += 1
+                set_domain_strategy(domain, "http")
                 
                 if progress_emitter:
                     progress_emitter.emit_event(
@@ -161,6 +197,7 @@ class URLParser(BaseParser):
             self.rate_limiter.record_success(url)
             self.metrics["successful_requests"] += 1
             self.metrics["manual_parsing_used"] += 1
+            set_domain_strategy(domain, "http")
             
             if progress_emitter:
                 progress_emitter.emit_event(
@@ -206,6 +243,7 @@ class URLParser(BaseParser):
                     self.rate_limiter.record_success(url)
                     self.metrics["successful_requests"] += 1
                     self.metrics["browser_automation_used"] += 1
+                    set_domain_strategy(domain, "browser")
                     
                     if progress_emitter:
                         progress_emitter.emit_event(
@@ -254,6 +292,7 @@ class URLParser(BaseParser):
                     self.rate_limiter.record_success(url)
                     self.metrics["successful_requests"] += 1
                     self.metrics["browser_automation_used"] += 1
+                    set_domain_strategy(domain, "browser")
                     return result
                 except Exception as browser_error:
                     logger.error(f"Browser automation also failed: {browser_error}")
@@ -443,7 +482,23 @@ class URLParser(BaseParser):
         
         try:
             async with BrowserAutomation() as browser:
-                html_content, page_title = await browser.fetch_page_content(url, wait_for_content=True)
+                html_content, page_title, json_ld_scripts = await browser.fetch_page_content(
+                    url, wait_for_content=True
+                )
+                
+                # Try structured data first (JSON-LD, already extracted in the browser);
+                # a Recipe payload means the page wasn't blocked, so skip the HTML parse
+                for raw_json_ld in json_ld_scripts:
+                    try:
+                        data = json.loads(raw_json_ld)
+                        if isinstance(data, list):
+                            data = data[0]
+                        
+                        if data.get('@type') == 'Recipe':
+                            logger.debug("Found JSON-LD recipe data via browser automation")
+                            return self._parse_json_ld_recipe(data, url)
+                    except:
+                        continue
                 
                 # Parse the retrieved HTML content
                 soup = BeautifulSoup(html_content, 'html.parser')
@@ -455,20 +510,6 @@ class URLParser(BaseParser):
                         "Website is still blocking access even with browser automation"
                     )
                 
-                # Try to extract structured data first (JSON-LD)
-                json_ld = soup.find('script', {'type': 'application/ld+json'})
-                if json_ld:
-                    try:
-                        data = json.loads(json_ld.string)
-                        if isinstance(data, list):
-                            data = data[0]
-                        
-                        if data.get('@type') == 'Recipe':
-                            logger.debug("Found JSON-LD recipe data via browser automation")
-                            return self._parse_json_ld_recipe(data, url)
-                    except:
-                        pass
-                
                 # Try Jump to Recipe approach
                 recipe_section = self._find_recipe_section_via_jump_link(soup)
                 if recipe_section:
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from app.services.parsers.browser_automation import BrowserPool
+
+
+class FakeBrowser:
+    def __init__(self, close_delay: float = 0.0):
+        self.close_delay = close_delay
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    async def close(self) -> None:
+        await asyncio.sleep(self.close_delay)
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self, close_delay: float = 0.0, failures: int = 0):
+        self.close_delay = close_delay
+        self.failures = failures
+        self.opened = []
+
+    async def launch(self, **kwargs) -> FakeBrowser:
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("launch failed")
+        browser = FakeBrowser(self.close_delay)
+        self.opened.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self, chromium: FakeChromium):
+        self.chromium = chromium
+
+    async def stop(self) -> None:
+        pass
+
+
+def make_pool(size: int, recycle_after: int, chromium: FakeChromium) -> BrowserPool:
+    pool = BrowserPool(size, recycle_after)
+    pool._playwright = FakePlaywright(chromium)
+    pool._available = asyncio.Queue()
+    return pool
+
+
+def live_browsers(chromium: FakeChromium) -> int:
+    return sum(not browser.closed for browser in chromium.opened)
+
+
+@pytest.mark.asyncio
+async def test_recycle_overlapping_acquire_stays_within_size():
+    chromium = FakeChromium(close_delay=0.05)
+    pool = make_pool(size=1, recycle_after=1, chromium=chromium)
+
+    async with pool.acquire():
+        pass
+
+    # Let the recycle get into closing the old browser; this acquire must wait for its replacement
+    await asyncio.sleep(0.01)
+    async with pool.acquire():
+        assert pool._launched <= pool.size
+        assert live_browsers(chromium) <= pool.size
+
+    await asyncio.gather(*pool._recycle_tasks)
+    assert pool._launched <= pool.size
+    assert live_browsers(chromium) <= pool.size
+
+
+@pytest.mark.asyncio
+async def test_failed_relaunch_wakes_blocked_acquirer():
+    chromium = FakeChromium()
+    pool = make_pool(size=1, recycle_after=1, chromium=chromium)
+
+    holding = asyncio.Event()
+
+    async def use():
+        async with pool.acquire():
+            holding.set()
+            await asyncio.sleep(0.01)
+
+    first = asyncio.create_task(use())
+    await holding.wait()
+    chromium.failures = 1  # The recycle after `first` fails to relaunch
+    await asyncio.wait_for(asyncio.gather(first, use()), timeout=1)
+    assert pool._launched <= pool.size
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.parsers import request_utils
+from app.services.parsers.request_utils import RateLimiter
+
+URL = "https://example.com/recipe"
+DELAY = 0.05
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(request_utils.random, "random", lambda: 0.5)
+
+
+async def timed_waits(limiter: RateLimiter, count: int):
+    released = []
+
+    async def wait(index: int):
+        await limiter.wait_for_domain(URL)
+        released.append((index, time.monotonic()))
+
+    tasks = [asyncio.create_task(wait(index)) for index in range(count)]
+    return tasks, released
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_released_in_arrival_order():
+    limiter = RateLimiter(default_delay=DELAY)
+    tasks, released = await timed_waits(limiter, 4)
+
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    assert [index for index, _ in released] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_releases_are_spaced_by_the_delay():
+    limiter = RateLimiter(default_delay=DELAY)
+    tasks, released = await timed_waits(limiter, 3)
+
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    times = [at for _, at in released]
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert all(gap >= DELAY * 0.9 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_burst_releases_back_to_back_when_idle():
+    limiter = RateLimiter(default_delay=DELAY, burst=2)
+    tasks, released = await timed_waits(limiter, 3)
+
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    times = [at for _, at in released]
+    assert times[1] - times[0] < DELAY / 2
+    assert times[2] - times[1] >= DELAY * 0.9
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_skipped():
+    limiter = RateLimiter(default_delay=DELAY)
+    tasks, released = await timed_waits(limiter, 3)
+    await asyncio.sleep(0)
+
+    tasks[1].cancel()
+    await asyncio.wait_for(asyncio.gather(tasks[0], tasks[2]), timeout=1)
+
+    assert [index for index, _ in released] == [0, 2]
+    # The cancelled waiter does not consume a slot
+    assert released[1][1] - released[0][1] < DELAY * 1.5
+    assert not limiter._pending and not limiter._timers
@@ -0,0 +1,67 @@
+import pytest
+
+from app.services.parsers.text_processor import TextProcessor
+
+
+@pytest.fixture
+def processor():
+    return TextProcessor()
+
+
+@pytest.mark.parametrize("line", [
+    "2 lbs potatoes",
+    "3 tbsps soy sauce",
+    "2 tsps cumin",
+    "1 pinches of saffron",
+    "2 dashes bitters",
+    "2 bell peppers",
+    "3 tomatoes",
+    "250g butter",
+    "500ml stock",
+])
+def test_plural_and_abbreviated_ingredients(processor, line):
+    assert processor._looks_like_ingredient(line)
+
+
+@pytest.mark.parametrize("line", [
+    "Mix well and bake for 20 minutes",
+    "Chop the onions finely and set aside",
+])
+def test_single_letter_units_do_not_match_inside_words(processor, line):
+    assert not processor._looks_like_ingredient(line)
+
+
+@pytest.mark.parametrize("line", [
+    "Chopped the onions and fried them",
+    "Whisking the eggs and sugar together",
+    "Stirring constantly, simmered the sauce gently",
+])
+def test_inflected_cooking_verbs_look_like_instructions(processor, line):
+    assert processor._looks_like_instruction(line)
+    assert processor._looks_like_instruction_not_ingredient(line)
+
+
+@pytest.mark.parametrize("line, section", [
+    ("Ingredients:", "ingredients"),
+    ("INGREDIENTS 👇", "ingredients"),
+    ("INGREDIENTS (serves 4)", "ingredients"),
+    ("Ingredients for the cake:", "ingredients"),
+    ("You'll need:", "ingredients"),
+    ("Instructions", "instructions"),
+    ("- Method -", "instructions"),
+    ("Directions for the glaze:", "instructions"),
+])
+def test_header_lines_start_sections(processor, line, section):
+    sections = processor._split_into_sections(f"{line}\nfirst item")
+    assert sections[section] == ["first item"]
+    assert line not in sum(sections.values(), [])
+
+
+@pytest.mark.parametrize("line", [
+    "Step 1: Whisk the flour and sugar together",
+    "Step 2: Heat a pan over medium heat",
+    "This method works for any ingredient you have",
+    "you need a large bowl",
+])
+def test_lines_mentioning_keywords_are_not_headers(processor, line):
+    assert processor._split_into_sections(line)["other"] == [line]